@@ -5,112 +5,371 @@ Automated testing, monitoring, and AI-driven web interactions
 """
 
 import asyncio
+import atexit
+import hashlib
 import json
+import os
+import queue
 import subprocess
 import sys
 from pathlib import Path
-import time
+from typing import Dict, Optional
 from datetime import datetime
-import requests
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Largest single JSON response accepted from the automation worker
+WORKER_LINE_LIMIT = 16 * 1024 * 1024
+
+# Interactive menu: (key, label, command)
+MENU_OPTIONS = [
+    ("1", "Health Check", "health"),
+    ("2", "Security Scan (Advanced)", "security"),
+    ("3", "Performance Test (with Core Web Vitals)", "performance"),
+    ("4", "AI Content Analysis", "content"),
+    ("5", "Visual Regression Test", "visual"),
+    ("6", "Start AI Dashboard & Orchestrator", "dashboard"),
+    ("7", "Run Complete AI Suite", "all"),
+    ("8", "Generate Report", "report"),
+    ("9", "Install/Update Dependencies", "install"),
+    ("0", "Exit", "exit"),
+]
+
+# Menu text for the plain prompt, rendered once
+MENU_TEXT = "\nAvailable commands:\n" + "\n".join(f"{key}. {label}" for key, label, _ in MENU_OPTIONS)
+
+# Interactive commands that run Node scripts directly
+NODE_COMMANDS = {"security", "performance", "content", "visual", "dashboard", "all", "report"}
+
+try:
+    import questionary
+except ImportError:
+    questionary = None
+
+
+try:
+    import orjson
+    
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+# Generated files are encoded once at import and written as raw bytes
+PACKAGE_JSON = dumps({
+    "name": "artifactvirtual-automation",
+    "version": "1.0.0",
+    "description": "AI-driven automation with Puppeteer",
+    "main": "automation.js",
+    "dependencies": {
+        "puppeteer": "^21.5.0",
+        "puppeteer-extra": "^3.3.6",
+        "puppeteer-extra-plugin-stealth": "^2.11.2",
+        "puppeteer-extra-plugin-adblocker": "^2.13.6",
+        "puppeteer-extra-plugin-recaptcha": "^3.6.8",
+        "playwright": "^1.40.0",
+        "axios": "^1.6.0",
+        "cheerio": "^1.0.0-rc.12",
+        "screenshot-desktop": "^1.12.7",
+        "lighthouse": "^11.4.0",
+        "chrome-har": "^0.13.4",
+        "pageres": "^6.2.0",
+        "puppeteer-cluster": "^0.23.0",
+        "pdf-parse": "^1.1.1",
+        "tesseract.js": "^5.0.3",
+        "puppeteer-har": "^1.1.2",
+        "sharp": "^0.33.0"
+    },
+    "optionalDependencies": {
+        "re2": "^1.20.9"
+    },
+    "scripts": {
+        "test": "node automation.js",
+        "monitor": "node monitor.js",
+        "security-scan": "node security_scan.js",
+        "ai-suite": "node advanced_ai_automation.js",
+        "orchestrator": "node orchestrator_fixed.js",
+        "dashboard": "node orchestrator_fixed.js dashboard",
+        "start": "node orchestrator_fixed.js dashboard"
+    }
+})
+
+DEFAULT_CONFIG = dumps({
+    "headless": False,
+    "defaultTimeout": 30000,
+    "viewport": {"width": 1920, "height": 1080},
+    "userAgent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "targets": {
+        "local": "https://localhost:8443",
+        "health": "https://localhost:8443/health"
+    },
+    "monitoring": {
+        "interval": 30,
+        "heartbeat": 300,
+        "alerts": True,
+        "screenshots": True
+    }
+})
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write bytes to path, skipping the write when content is unchanged"""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
 
 
 class AIAutomationEngine:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent.absolute()
-        self.scripts_dir = self.base_dir / "automation_scripts"
-        self.logs_dir = self.base_dir / "automation_logs"
-        self.config_dir = self.base_dir / "automation_config"
+    def __init__(self) -> None:
+        self.base_dir: Path = Path(__file__).parent.absolute()
+        self.scripts_dir: Path = self.base_dir / "automation_scripts"
+        self.logs_dir: Path = self.base_dir / "automation_logs"
+        self.config_dir: Path = self.base_dir / "automation_config"
+        self._automation_js_path: str = str(self.scripts_dir / "automation.js")
         
         for dir_path in [self.scripts_dir, self.logs_dir, self.config_dir]:
             dir_path.mkdir(exist_ok=True)
         
+        # Persistent Node worker (spawned lazily by _rpc)
+        self._worker: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._request_id: int = 0
+        
+        # Node dependencies are checked on first use, not at construction
+        self._deps_ready: bool = False
+        
+        self._log_listener: Optional[QueueListener] = None
         self.setup_logging()
-        self.install_puppeteer()
     
-    def setup_logging(self):
+    def setup_logging(self) -> None:
         """Setup logging for automation"""
         log_file = self.logs_dir / f"automation_{datetime.now().strftime('%Y%m%d')}.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        
+        file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=3)
+        stream_handler = logging.StreamHandler()
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; a background thread does the writes
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        self._log_listener = QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
         )
+        self._log_listener.start()
+        atexit.register(self.stop_logging)
+        
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         self.logger = logging.getLogger(__name__)
     
-    def install_puppeteer(self):
+    def stop_logging(self) -> None:
+        """Flush queued log records and stop the listener thread"""
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+    
+    def install_puppeteer(self) -> None:
         """Install Puppeteer and dependencies"""
         package_json = self.base_dir / "package.json"
         
         if not package_json.exists():
             self.logger.info("📦 Creating package.json for Puppeteer...")
-            package_config = {
-                "name": "artifactvirtual-automation",
-                "version": "1.0.0",
-                "description": "AI-driven automation with Puppeteer",
-                "main": "automation.js",
-                "dependencies": {
-                    "puppeteer": "^21.5.0",
-                    "puppeteer-extra": "^3.3.6",
-                    "puppeteer-extra-plugin-stealth": "^2.11.2",
-                    "puppeteer-extra-plugin-adblocker": "^2.13.6",
-                    "puppeteer-extra-plugin-recaptcha": "^3.6.8",
-                    "playwright": "^1.40.0",
-                    "axios": "^1.6.0",
-                    "cheerio": "^1.0.0-rc.12",
-                    "screenshot-desktop": "^1.12.7",
-                    "lighthouse": "^11.4.0",
-                    "chrome-har": "^0.13.4",
-                    "pageres": "^6.2.0",
-                    "puppeteer-cluster": "^0.23.0",
-                    "pdf-parse": "^1.1.1",
-                    "tesseract.js": "^5.0.3",
-                    "opencv4nodejs": "^5.6.0",
-                    "puppeteer-har": "^1.1.2",
-                    "sharp": "^0.33.0"
-                },
-                "scripts": {
-                    "test": "node automation.js",
-                    "monitor": "node monitor.js",
-                    "security-scan": "node security_scan.js",
-                    "ai-suite": "node advanced_ai_automation.js",
-                    "orchestrator": "node orchestrator_fixed.js",
-                    "dashboard": "node orchestrator_fixed.js dashboard",
-                    "start": "node orchestrator_fixed.js dashboard"
-                }
-            }
-            
-            with open(package_json, 'w') as f:
-                json.dump(package_config, f, indent=2)
+            write_if_changed(package_json, PACKAGE_JSON)
+        
+        lockfile = self.base_dir / "package-lock.json"
+        node_modules = self.base_dir / "node_modules"
         
-        # Check if node_modules exists
-        if not (self.base_dir / "node_modules").exists():
+        if lockfile.exists():
+            # Skip npm entirely while the lockfile matches the last install
+            if node_modules.exists() and self._read_deps_stamp() == self._lockfile_digest():
+                return
+            
+            self.logger.info("📥 Installing Puppeteer dependencies from lockfile...")
+            subprocess.run(
+                ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"],
+                cwd=self.base_dir, check=True
+            )
+        elif not node_modules.exists():
             self.logger.info("📥 Installing Puppeteer dependencies...")
-            subprocess.run(["npm", "install"], cwd=self.base_dir, check=True)
-            self.logger.info("✅ Puppeteer installed successfully")
+            subprocess.run(["npm", "install", "--no-audit", "--no-fund"], cwd=self.base_dir, check=True)
+        else:
+            return
+        
+        self._write_deps_stamp()
+        self.logger.info("✅ Puppeteer installed successfully")
+    
+    async def _ensure_deps(self) -> None:
+        """Install Node dependencies once, on first use"""
+        if self._deps_ready:
+            return
+        # npm can take minutes; keep the event loop (and the worker reader) running
+        await asyncio.to_thread(self.install_puppeteer)
+        self._deps_ready = True
+    
+    def _lockfile_digest(self) -> Optional[str]:
+        """SHA-256 of package-lock.json, or None when there is no lockfile"""
+        lockfile = self.base_dir / "package-lock.json"
+        if not lockfile.exists():
+            return None
+        return hashlib.sha256(lockfile.read_bytes()).hexdigest()
+    
+    def _read_deps_stamp(self) -> Optional[str]:
+        stamp = self.config_dir / ".deps.stamp"
+        return stamp.read_text().strip() if stamp.exists() else None
+    
+    def _write_deps_stamp(self) -> None:
+        digest = self._lockfile_digest()
+        if digest:
+            (self.config_dir / ".deps.stamp").write_text(digest)
     
-    def create_automation_scripts(self):
+    def create_automation_scripts(self) -> None:
         """Create core automation scripts"""
         
         # Main automation controller
         automation_js = '''
-const puppeteer = require('puppeteer-extra');
-const StealthPlugin = require('puppeteer-extra-plugin-stealth');
-const AdblockerPlugin = require('puppeteer-extra-plugin-adblocker');
+const crypto = require('crypto');
 const fs = require('fs');
 const path = require('path');
 
-puppeteer.use(StealthPlugin());
-puppeteer.use(AdblockerPlugin());
+// Plugins are registered per command: stealth evasions only matter for tasks
+// that face bot detection (the long-lived worker serves those too), and the
+// adblocker's filter lists are only fetched when asked for with --adblock
+const COMMAND = process.argv[2] || 'health';
+const useStealth = ['security', 'ai', 'worker'].includes(COMMAND) || process.argv.includes('--stealth');
+const useAdblock = process.argv.includes('--adblock');
+
+const puppeteer = require(useStealth || useAdblock ? 'puppeteer-extra' : 'puppeteer');
+if (useStealth) {
+    const StealthPlugin = require('puppeteer-extra-plugin-stealth');
+    puppeteer.use(StealthPlugin());
+}
+if (useAdblock) {
+    const AdblockerPlugin = require('puppeteer-extra-plugin-adblocker');
+    puppeteer.use(AdblockerPlugin());
+}
+
+// Sensitive-data markers as one alternation. node-re2 runs it as a DFA
+// (no backtracking) when installed; the built-in engine is the fallback.
+let PatternEngine = RegExp;
+try {
+    PatternEngine = require('re2');
+} catch (error) {
+    // re2 is an optional dependency
+}
+const SENSITIVE_PATTERN = new PatternEngine('password|api[_-]?key|secret|token', 'gi');
+const SENSITIVE_CATEGORIES = 4;
+
+// Multi-MB pages are scanned as bytes instead: Buffer.indexOf runs a native
+// substring search and skips the regex engine's UTF-16 walk
+const BYTE_SCAN_THRESHOLD = 1 << 20;
+const SENSITIVE_NEEDLES = [
+    ['password', 'password'],
+    ['secret', 'secret'],
+    ['token', 'token'],
+    ['api key', 'apikey'],
+    ['api key', 'api_key'],
+    ['api key', 'api-key']
+].map(([category, needle]) => [category, Buffer.from(needle)]);
+
+// Screenshots are named from the run start time plus a sequence number
+const RUN_ID = Date.now();
+let artifactSequence = 0;
+
+// Digest of the last health page captured, so unchanged pages are not re-screenshotted
+let lastHealthDigest = null;
+
+// Longest a single monitoring task may run (the health watcher is exempt)
+const MAX_TIMER_MS = 2 ** 31 - 1;
+
+function withTimeout(promise, ms, label) {
+    let timer;
+    const timeout = new Promise((resolve, reject) => {
+        timer = setTimeout(() => reject(new Error(`${label} timed out after ${ms}ms`)), ms);
+    });
+    return Promise.race([promise, timeout]).finally(() => clearTimeout(timer));
+}
+
+// Page-side collectors, serialized into Runtime.evaluate expressions
+function collectPageStructure() {
+    // Walk the DOM in document order and stop at the first 100 elements
+    const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_ELEMENT);
+    const elements = [];
+    
+    for (let element = walker.currentNode; element && elements.length < 100; element = walker.nextNode()) {
+        elements.push({
+            tag: element.tagName,
+            id: element.id,
+            classes: [...element.classList],
+            text: element.textContent?.substring(0, 100)
+        });
+    }
+    
+    return elements;
+}
+
+function collectA11yIssues() {
+    const issues = [];
+    
+    // Check for missing alt attributes
+    for (const img of document.images) {
+        if (!img.hasAttribute('alt')) {
+            issues.push('Image missing alt attribute');
+        }
+    }
+    
+    // Check for proper heading structure
+    if (!document.querySelector('h1,h2,h3,h4,h5,h6')) {
+        issues.push('No heading elements found');
+    }
+    
+    return issues;
+}
+
+function collectTiming() {
+    // returnByValue already serializes the result, so no JSON round-trip here
+    const navigation = performance.getEntriesByType('navigation')[0];
+    return navigation ? navigation.toJSON() : performance.timing.toJSON();
+}
 
 class AIAutomation {
     constructor() {
         this.browser = null;
         this.page = null;
+        this.cdp = null;
         this.config = this.loadConfig();
+        
+        // Reports are appended to a per-day NDJSON stream, named like the Python log.
+        // One holder object, so cluster tasks (prototype clones) share and rotate it
+        this.log = { date: null, stream: null };
+        this.openLogStream();
+    }
+    
+    openLogStream() {
+        const now = new Date();
+        const date = `${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}`;
+        const log = this.log;
+        if (date === log.date) return;
+        
+        if (log.stream) log.stream.end();
+        log.date = date;
+        log.stream = fs.createWriteStream(`automation_logs/events_${date}.ndjson`, {
+            flags: 'a',
+            highWaterMark: 1 << 16
+        });
     }
     
     loadConfig() {
@@ -130,10 +389,8 @@ class AIAutomation {
         }
     }
     
-    async init() {
-        console.log('🤖 Initializing AI Automation Engine...');
-        
-        this.browser = await puppeteer.launch({
+    launchOptions() {
+        return {
             headless: this.config.headless,
             defaultViewport: this.config.viewport,
             args: [
@@ -148,34 +405,149 @@ class AIAutomation {
                 '--ignore-ssl-errors',
                 '--ignore-certificate-errors-spki-list'
             ]
-        });
+        };
+    }
+    
+    async init() {
+        console.log('🤖 Initializing AI Automation Engine...');
+        
+        this.browser = await puppeteer.launch(this.launchOptions());
+        await this.attach(await this.browser.newPage());
         
-        this.page = await this.browser.newPage();
+        console.log('✅ Browser initialized');
+    }
+    
+    async attach(page) {
+        this.page = page;
         await this.page.setUserAgent(this.config.userAgent);
         await this.page.setViewport(this.config.viewport);
         
-        console.log('✅ Browser initialized');
+        // Raw DevTools Protocol session over the browser's existing WebSocket
+        this.cdp = await this.page.target().createCDPSession();
+        await Promise.all([
+            this.cdp.send('Page.enable'),
+            this.cdp.send('Network.enable'),
+            this.cdp.send('Runtime.enable'),
+            this.cdp.send('Performance.enable')
+        ]);
+    }
+    
+    async navigate(url, timeout = this.config.defaultTimeout) {
+        // Page.navigate + Page.loadEventFired, capturing the main document response
+        const documents = new Map();
+        const onResponse = ({ loaderId, type, response }) => {
+            if (type === 'Document') {
+                documents.set(loaderId, response);
+            }
+        };
+        
+        let onLoad;
+        const loaded = new Promise(resolve => {
+            onLoad = resolve;
+        });
+        
+        this.cdp.on('Network.responseReceived', onResponse);
+        this.cdp.on('Page.loadEventFired', onLoad);
+        
+        try {
+            const { loaderId, errorText } = await this.cdp.send('Page.navigate', { url });
+            if (errorText) {
+                throw new Error(`Navigation to ${url} failed: ${errorText}`);
+            }
+            
+            await withTimeout(loaded, timeout, `Navigation to ${url}`);
+            
+            const response = documents.get(loaderId);
+            const headers = {};
+            if (response) {
+                for (const [name, value] of Object.entries(response.headers)) {
+                    headers[name.toLowerCase()] = value;
+                }
+            }
+            
+            return { status: response ? response.status : 0, headers };
+        } finally {
+            this.cdp.off('Network.responseReceived', onResponse);
+            this.cdp.off('Page.loadEventFired', onLoad);
+        }
+    }
+    
+    async evaluate(fn) {
+        const expression = typeof fn === 'function' ? `(${fn.toString()})()` : fn;
+        const { result, exceptionDetails } = await this.cdp.send('Runtime.evaluate', {
+            expression,
+            returnByValue: true,
+            awaitPromise: true
+        });
+        
+        if (exceptionDetails) {
+            throw new Error(exceptionDetails.exception?.description || exceptionDetails.text);
+        }
+        return result.value;
+    }
+    
+    async content() {
+        return this.evaluate('document.documentElement.outerHTML');
+    }
+    
+    async screenshot(filePath, { fullPage = true, format = 'png', quality, clip } = {}) {
+        const params = { format };
+        
+        if (format === 'jpeg' && quality) {
+            params.quality = quality;
+        }
+        
+        if (clip) {
+            params.clip = { ...clip, scale: 1 };
+        } else if (fullPage) {
+            const { cssContentSize } = await this.cdp.send('Page.getLayoutMetrics');
+            params.captureBeyondViewport = true;
+            params.clip = {
+                x: 0,
+                y: 0,
+                width: Math.ceil(cssContentSize.width),
+                height: Math.ceil(cssContentSize.height),
+                scale: 1
+            };
+        }
+        
+        const { data } = await this.cdp.send('Page.captureScreenshot', params);
+        await fs.promises.writeFile(filePath, Buffer.from(data, 'base64'));
+    }
+    
+    async metrics() {
+        const { metrics } = await this.cdp.send('Performance.getMetrics');
+        return Object.fromEntries(metrics.map(({ name, value }) => [name, value]));
     }
     
     async healthCheck() {
         console.log('🏥 Running health check...');
         
         try {
-            await this.page.goto(this.config.targets.health, { 
-                waitUntil: 'networkidle2',
-                timeout: this.config.defaultTimeout 
-            });
+            await this.navigate(this.config.targets.health);
             
-            const content = await this.page.content();
+            const content = await this.content();
             const isHealthy = content.includes('healthy');
             
             console.log(`Health status: ${isHealthy ? '✅ Healthy' : '❌ Unhealthy'}`);
             
-            // Take screenshot
-            await this.page.screenshot({
-                path: `automation_logs/health_check_${Date.now()}.png`,
-                fullPage: true
-            });
+            // Take screenshot, unless the page is identical to the last one captured
+            const digest = crypto.createHash('sha1').update(content).digest('hex');
+            const screenshots = !this.config.monitoring || this.config.monitoring.screenshots !== false;
+            if (screenshots && digest !== lastHealthDigest) {
+                if (isHealthy) {
+                    // A small JPEG of the top of the page is enough to show a healthy status
+                    await this.screenshot(this.artifactPath('health_check', 'jpg'), {
+                        format: 'jpeg',
+                        quality: 60,
+                        clip: { x: 0, y: 0, width: 800, height: 600 }
+                    });
+                } else {
+                    // Keep the full page when something is wrong
+                    await this.screenshot(this.artifactPath('health_check', 'png'));
+                }
+                lastHealthDigest = digest;
+            }
             
             return isHealthy;
         } catch (error) {
@@ -184,65 +556,84 @@ class AIAutomation {
         }
     }
     
+    auditHeaders(headers) {
+        const securityHeaders = [
+            'x-frame-options',
+            'x-content-type-options', 
+            'x-xss-protection',
+            'strict-transport-security'
+        ];
+        
+        return securityHeaders
+            .filter(header => !headers[header])
+            .map(header => `Missing security header: ${header}`);
+    }
+    
+    auditContent(content) {
+        const found = new Set();
+        
+        if (content.length > BYTE_SCAN_THRESHOLD) {
+            // Lowercase once, then one native search per needle
+            const bytes = Buffer.from(content.toLowerCase());
+            for (const [category, needle] of SENSITIVE_NEEDLES) {
+                if (!found.has(category) && bytes.indexOf(needle) !== -1) {
+                    found.add(category);
+                }
+            }
+            return [...found].map(category => `Potential sensitive data exposure: ${category}`);
+        }
+        
+        // Single sweep over the content; stops once every category has been seen
+        let match;
+        
+        SENSITIVE_PATTERN.lastIndex = 0;
+        while (found.size < SENSITIVE_CATEGORIES &&
+               (match = SENSITIVE_PATTERN.exec(content)) !== null) {
+            const hit = match[0].toLowerCase();
+            found.add(hit.startsWith('api') ? 'api key' : hit);
+        }
+        
+        return [...found].map(category => `Potential sensitive data exposure: ${category}`);
+    }
+    
+    writeReport(type, data) {
+        // Long-running monitor/worker processes roll over at midnight
+        this.openLogStream();
+        this.log.stream.write(JSON.stringify({ type, ts: Date.now(), ...data }) + '\\n');
+    }
+    
+    artifactPath(name, extension) {
+        return `automation_logs/${name}_${RUN_ID}_${++artifactSequence}.${extension}`;
+    }
+    
     async securityScan() {
         console.log('🛡️ Running security scan...');
         
-        const vulnerabilities = [];
-        
         try {
             // Check for common security headers
-            const response = await this.page.goto(this.config.targets.local, {
-                waitUntil: 'networkidle2'
-            });
-            
-            const headers = response.headers();
-            
-            const securityHeaders = [
-                'x-frame-options',
-                'x-content-type-options', 
-                'x-xss-protection',
-                'strict-transport-security'
-            ];
-            
-            securityHeaders.forEach(header => {
-                if (!headers[header]) {
-                    vulnerabilities.push(`Missing security header: ${header}`);
-                }
-            });
+            const { headers } = await this.navigate(this.config.targets.local);
             
             // Check for exposed sensitive information
-            const content = await this.page.content();
-            const sensitivePatterns = [
-                /password/i,
-                /api[_-]?key/i,
-                /secret/i,
-                /token/i
-            ];
+            const content = await this.content();
             
-            sensitivePatterns.forEach(pattern => {
-                if (pattern.test(content)) {
-                    vulnerabilities.push(`Potential sensitive data exposure: ${pattern}`);
-                }
-            });
+            const vulnerabilities = [
+                ...this.auditHeaders(headers),
+                ...this.auditContent(content)
+            ];
             
             // Test for XSS
-            await this.page.evaluate(() => {
+            await this.evaluate(() => {
                 window.xssTest = '<script>alert("XSS")</script>';
             });
             
             console.log(`Security scan complete. Found ${vulnerabilities.length} issues.`);
             
             // Save results
-            const results = {
+            this.writeReport('security_scan', {
                 timestamp: new Date().toISOString(),
                 vulnerabilities: vulnerabilities,
                 headers: headers
-            };
-            
-            fs.writeFileSync(
-                `automation_logs/security_scan_${Date.now()}.json`,
-                JSON.stringify(results, null, 2)
-            );
+            });
             
             return vulnerabilities;
             
@@ -256,17 +647,13 @@ class AIAutomation {
         console.log('⚡ Running performance test...');
         
         try {
-            const metrics = await this.page.metrics();
+            const metrics = await this.metrics();
             
             const startTime = Date.now();
-            await this.page.goto(this.config.targets.local, {
-                waitUntil: 'networkidle2'
-            });
+            await this.navigate(this.config.targets.local);
             const loadTime = Date.now() - startTime;
             
-            const performanceData = await this.page.evaluate(() => {
-                return JSON.parse(JSON.stringify(performance.timing));
-            });
+            const performanceData = await this.evaluate(collectTiming);
             
             const results = {
                 timestamp: new Date().toISOString(),
@@ -275,10 +662,7 @@ class AIAutomation {
                 timing: performanceData
             };
             
-            fs.writeFileSync(
-                `automation_logs/performance_${Date.now()}.json`,
-                JSON.stringify(results, null, 2)
-            );
+            this.writeReport('performance', results);
             
             console.log(`⚡ Load time: ${loadTime}ms`);
             return results;
@@ -289,75 +673,210 @@ class AIAutomation {
         }
     }
     
+    async fullScan() {
+        // Security, performance and AI analysis from a single page load
+        console.log('🔬 Running full scan...');
+        
+        try {
+            const metrics = await this.metrics();
+            
+            const startTime = Date.now();
+            const { headers } = await this.navigate(this.config.targets.local);
+            const loadTime = Date.now() - startTime;
+            
+            // One Runtime.evaluate round-trip for everything the reports need
+            const snapshot = await this.evaluate(`({
+                html: document.documentElement.outerHTML,
+                structure: (${collectPageStructure})(),
+                a11y: (${collectA11yIssues})(),
+                timing: (${collectTiming})()
+            })`);
+            
+            const timestamp = new Date().toISOString();
+            
+            const vulnerabilities = [
+                ...this.auditHeaders(headers),
+                ...this.auditContent(snapshot.html)
+            ];
+            this.writeReport('security_scan', {
+                timestamp: timestamp,
+                vulnerabilities: vulnerabilities,
+                headers: headers
+            });
+            
+            const performanceResults = {
+                timestamp: timestamp,
+                loadTime: loadTime,
+                metrics: metrics,
+                timing: snapshot.timing
+            };
+            this.writeReport('performance', performanceResults);
+            
+            const analysis = {
+                timestamp: timestamp,
+                pageStructure: snapshot.structure,
+                accessibilityIssues: snapshot.a11y,
+                recommendations: this.generateRecommendations(snapshot.structure, snapshot.a11y)
+            };
+            this.writeReport('ai_analysis', analysis);
+            
+            console.log(`🔬 Full scan complete. ${vulnerabilities.length} issues, load time ${loadTime}ms`);
+            return { vulnerabilities, performance: performanceResults, analysis };
+            
+        } catch (error) {
+            console.error('❌ Full scan failed:', error.message);
+            return null;
+        }
+    }
+    
+    async watchHealth() {
+        // Keep the health page open and probe it with fetch(); the monitor is
+        // only told when the endpoint's status changes
+        const healthUrl = this.config.targets.health;
+        let lastStatus = null;
+        
+        const report = (status) => {
+            if (status !== lastStatus) {
+                lastStatus = status;
+                this.onHealthChange(status);
+            }
+        };
+        
+        const probes = new Set();
+        this.cdp.on('Network.requestWillBeSent', ({ requestId, request }) => {
+            if (request.url === healthUrl) {
+                probes.add(requestId);
+            }
+        });
+        this.cdp.on('Network.responseReceived', ({ requestId, response }) => {
+            if (probes.delete(requestId)) {
+                report(response.status);
+            }
+        });
+        this.cdp.on('Network.loadingFailed', ({ requestId }) => {
+            if (probes.delete(requestId)) {
+                report(0);
+            }
+        });
+        
+        let stopped = false;
+        this.monitorStopped.then(() => {
+            stopped = true;
+        });
+        
+        while (!stopped) {
+            try {
+                await this.navigate(healthUrl);
+                await this.evaluate(`setInterval(() => {
+                    fetch(location.href, { cache: 'no-store' }).catch(() => {});
+                }, ${this.probeInterval})`);
+                await this.monitorStopped;
+            } catch (error) {
+                // Server unreachable: report it down and retry the page load
+                report(0);
+                await Promise.race([
+                    new Promise(resolve => setTimeout(resolve, this.probeInterval)),
+                    this.monitorStopped
+                ]);
+            }
+        }
+    }
+    
     async monitorSite() {
         console.log('👁️ Starting continuous monitoring...');
         
+        const monitoring = this.config.monitoring || {};
+        const interval = (monitoring.interval || 30) * 1000;
+        const heartbeat = (monitoring.heartbeat || 300) * 1000;
+        const taskTimeout = (this.config.defaultTimeout || 30000) * 4;
+        
+        // One browser, one incognito context per task: the health watcher
+        // holds one slot while checks and scans share the rest
+        const { Cluster } = require('puppeteer-cluster');
+        const cluster = await Cluster.launch({
+            concurrency: Cluster.CONCURRENCY_CONTEXT,
+            maxConcurrency: Math.max(2, this.config.concurrency || 4),
+            timeout: MAX_TIMER_MS,
+            puppeteer,
+            puppeteerOptions: this.launchOptions()
+        });
+        
+        await cluster.task(async ({ page, data: { op } }) => {
+            // Per-task view of this automation bound to the cluster's page
+            const task = Object.create(this);
+            await task.attach(page);
+            if (op === 'watchHealth') {
+                return task.watchHealth();
+            }
+            return withTimeout(task[op](), taskTimeout, op);
+        });
+        
+        let stopping = false;
+        let stop;
+        this.monitorStopped = new Promise(resolve => {
+            stop = resolve;
+        });
+        
+        cluster.on('taskerror', (error, data) => {
+            console.error(`❌ Monitoring ${data.op} error:`, error.message);
+            if (data.op === 'watchHealth' && !stopping) {
+                cluster.queue({ op: 'watchHealth' });
+            }
+        });
+        
         let iteration = 0;
         
-        while (true) {
+        const healthTick = async (reason) => {
+            iteration++;
+            console.log(`\n--- Monitoring Iteration ${iteration} (${reason}) ---`);
+            
             try {
-                iteration++;
-                console.log(`\\n--- Monitoring Iteration ${iteration} ---`);
-                
-                const health = await this.healthCheck();
+                const health = await cluster.execute({ op: 'healthCheck' });
                 
                 if (!health) {
                     console.log('🚨 Site is down! Sending alert...');
                     // Could integrate with notification systems here
                 }
-                
-                if (iteration % 10 === 0) {
-                    await this.securityScan();
-                    await this.performanceTest();
-                }
-                
-                // Wait 30 seconds before next check
-                await new Promise(resolve => setTimeout(resolve, 30000));
-                
             } catch (error) {
                 console.error('❌ Monitoring error:', error.message);
-                await new Promise(resolve => setTimeout(resolve, 60000)); // Wait longer on error
             }
-        }
+        };
+        
+        // Full checks run on status changes, with a slow heartbeat as a backstop
+        this.probeInterval = interval;
+        this.onHealthChange = (status) => {
+            console.log(`📡 Health endpoint status: ${status || 'unreachable'}`);
+            healthTick('status change');
+        };
+        cluster.queue({ op: 'watchHealth' });
+        
+        const healthTimer = setInterval(() => healthTick('heartbeat'), heartbeat);
+        const scanTimer = setInterval(() => cluster.queue({ op: 'fullScan' }), interval * 10);
+        
+        await new Promise(resolve => {
+            process.once('SIGINT', resolve);
+            process.once('SIGTERM', resolve);
+        });
+        
+        stopping = true;
+        stop();
+        clearInterval(healthTimer);
+        clearInterval(scanTimer);
+        await cluster.idle();
+        await cluster.close();
     }
     
     async aiAnalysis() {
         console.log('🧠 Running AI analysis...');
         
         try {
-            await this.page.goto(this.config.targets.local);
+            await this.navigate(this.config.targets.local);
             
             // Extract page structure
-            const pageStructure = await this.page.evaluate(() => {
-                const getElementInfo = (element) => ({
-                    tag: element.tagName,
-                    id: element.id,
-                    classes: Array.from(element.classList),
-                    text: element.textContent?.substring(0, 100)
-                });
-                
-                return Array.from(document.querySelectorAll('*'))
-                    .slice(0, 100) // Limit to first 100 elements
-                    .map(getElementInfo);
-            });
+            const pageStructure = await this.evaluate(collectPageStructure);
             
             // Analyze accessibility
-            const a11yIssues = await this.page.evaluate(() => {
-                const issues = [];
-                
-                // Check for missing alt attributes
-                document.querySelectorAll('img:not([alt])').forEach(img => {
-                    issues.push('Image missing alt attribute');
-                });
-                
-                // Check for proper heading structure
-                const headings = Array.from(document.querySelectorAll('h1,h2,h3,h4,h5,h6'));
-                if (headings.length === 0) {
-                    issues.push('No heading elements found');
-                }
-                
-                return issues;
-            });
+            const a11yIssues = await this.evaluate(collectA11yIssues);
             
             const analysis = {
                 timestamp: new Date().toISOString(),
@@ -366,10 +885,7 @@ class AIAutomation {
                 recommendations: this.generateRecommendations(pageStructure, a11yIssues)
             };
             
-            fs.writeFileSync(
-                `automation_logs/ai_analysis_${Date.now()}.json`,
-                JSON.stringify(analysis, null, 2)
-            );
+            this.writeReport('ai_analysis', analysis);
             
             console.log('🧠 AI analysis complete');
             return analysis;
@@ -395,11 +911,61 @@ class AIAutomation {
         return recommendations;
     }
     
+    async serve() {
+        // Persistent worker: one JSON request per stdin line, one JSON response per stdout line.
+        // Progress messages go to stderr so stdout carries only responses.
+        console.log = console.error;
+
+        const readline = require('readline');
+        const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+
+        const handlers = {
+            health: () => this.healthCheck(),
+            security: () => this.securityScan(),
+            performance: () => this.performanceTest(),
+            ai: () => this.aiAnalysis(),
+            all: () => this.fullScan()
+        };
+
+        console.log('🔌 Automation worker ready');
+
+        for await (const line of rl) {
+            if (!line.trim()) {
+                continue;
+            }
+
+            let request;
+            try {
+                request = JSON.parse(line);
+            } catch (error) {
+                console.error('❌ Invalid worker request:', error.message);
+                continue;
+            }
+
+            const response = { id: request.id };
+            const handler = handlers[request.cmd];
+
+            if (!handler) {
+                response.error = `Unknown command: ${request.cmd}`;
+            } else {
+                try {
+                    response.result = await handler();
+                } catch (error) {
+                    response.error = error.message;
+                }
+            }
+
+            process.stdout.write(JSON.stringify(response) + '\\n');
+        }
+    }
+
     async cleanup() {
         if (this.browser) {
             await this.browser.close();
             console.log('🧹 Browser closed');
         }
+        
+        await new Promise(resolve => this.log.stream.end(resolve));
     }
 }
 
@@ -408,11 +974,12 @@ async function main() {
     const automation = new AIAutomation();
     
     try {
-        await automation.init();
-        
-        const command = process.argv[2] || 'health';
+        // The monitor runs its own browser pool
+        if (COMMAND !== 'monitor') {
+            await automation.init();
+        }
         
-        switch (command) {
+        switch (COMMAND) {
             case 'health':
                 await automation.healthCheck();
                 break;
@@ -430,12 +997,13 @@ async function main() {
                 break;
             case 'all':
                 await automation.healthCheck();
-                await automation.securityScan();
-                await automation.performanceTest();
-                await automation.aiAnalysis();
+                await automation.fullScan();
+                break;
+            case 'worker':
+                await automation.serve();
                 break;
             default:
-                console.log('Usage: node automation.js [health|security|performance|monitor|ai|all]');
+                console.log('Usage: node automation.js [health|security|performance|monitor|ai|all|worker] [--stealth] [--adblock]');
         }
         
     } catch (error) {
@@ -452,81 +1020,131 @@ if (require.main === module) {
 module.exports = AIAutomation;
 '''
         
-        with open(self.scripts_dir / "automation.js", 'w') as f:
-            f.write(automation_js)
+        write_if_changed(Path(self._automation_js_path), automation_js.encode())
         
         # Create configuration
-        config = {
-            "headless": False,
-            "defaultTimeout": 30000,
-            "viewport": {"width": 1920, "height": 1080},
-            "userAgent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "targets": {
-                "local": "https://localhost:8443",
-                "health": "https://localhost:8443/health"
-            },
-            "monitoring": {
-                "interval": 30,
-                "alerts": True,
-                "screenshots": True
-            }
-        }
-        
-        with open(self.config_dir / "config.json", 'w') as f:
-            json.dump(config, f, indent=2)
+        write_if_changed(self.config_dir / "config.json", DEFAULT_CONFIG)
         
         self.logger.info("✅ Automation scripts created")
     
-    async def run_health_check(self):
+    async def _start_worker(self) -> None:
+        """Spawn the persistent Node automation worker on first use"""
+        if self._worker and self._worker.returncode is None:
+            return
+        
+        await self._ensure_deps()
+        self.logger.info("🔌 Starting automation worker...")
+        self._worker = await asyncio.create_subprocess_exec(
+            "node", self._automation_js_path, "worker",
+            cwd=self.base_dir,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=WORKER_LINE_LIMIT
+        )
+        self._reader_task = asyncio.create_task(self._read_worker(self._worker))
+    
+    async def _read_worker(self, worker: asyncio.subprocess.Process) -> None:
+        """Route worker responses to the requests waiting on them"""
+        assert worker.stdout is not None
+        async for line in worker.stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            
+            future = self._pending.pop(response.get("id"), None)
+            if future and not future.done():
+                future.set_result(response)
+        
+        # Worker exited - fail anything still waiting
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("automation worker exited"))
+        self._pending.clear()
+    
+    async def _rpc(self, cmd: str, timeout: float):
+        """Send a command to the automation worker and wait for its result"""
+        await self._start_worker()
+        worker = self._worker
+        assert worker is not None and worker.stdin is not None
+        
+        self._request_id += 1
+        request_id = self._request_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        
+        try:
+            request = json.dumps({"id": request_id, "cmd": cmd})
+            worker.stdin.write(request.encode() + b"\n")
+            await worker.stdin.drain()
+            response = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response.get("result")
+    
+    async def close(self) -> None:
+        """Shut down the automation worker"""
+        worker = self._worker
+        if worker and worker.returncode is None:
+            if worker.stdin:
+                worker.stdin.close()
+            try:
+                await asyncio.wait_for(worker.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                worker.kill()
+                await worker.wait()
+        
+        if self._reader_task:
+            await self._reader_task
+            self._reader_task = None
+        
+        self.stop_logging()
+    
+    async def run_health_check(self) -> bool:
         """Run health check automation"""
         self.logger.info("🏥 Running automated health check...")
         
         try:
-            result = subprocess.run([
-                "node", str(self.scripts_dir / "automation.js"), "health"
-            ], cwd=self.base_dir, capture_output=True, text=True, timeout=60)
+            healthy = await self._rpc("health", timeout=60)
             
-            if result.returncode == 0:
+            if healthy:
                 self.logger.info("✅ Health check passed")
                 return True
             else:
-                self.logger.error(f"❌ Health check failed: {result.stderr}")
+                self.logger.error("❌ Health check failed: site reported unhealthy")
                 return False
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.logger.error("❌ Health check timed out")
             return False
         except Exception as e:
             self.logger.error(f"❌ Health check error: {e}")
             return False
     
-    async def run_security_scan(self):
+    async def run_security_scan(self) -> bool:
         """Run security scan automation"""
         self.logger.info("🛡️ Running automated security scan...")
         
         try:
-            result = subprocess.run([
-                "node", str(self.scripts_dir / "automation.js"), "security"
-            ], cwd=self.base_dir, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0:
-                self.logger.info("✅ Security scan completed")
-                return True
-            else:
-                self.logger.error(f"❌ Security scan failed: {result.stderr}")
-                return False
+            vulnerabilities = await self._rpc("security", timeout=120)
+            self.logger.info(f"✅ Security scan completed ({len(vulnerabilities or [])} issues)")
+            return True
                 
         except Exception as e:
             self.logger.error(f"❌ Security scan error: {e}")
             return False
     
-    async def start_monitoring(self):
+    async def start_monitoring(self) -> Optional[subprocess.Popen]:
         """Start continuous monitoring"""
         self.logger.info("👁️ Starting continuous monitoring...")
         
         try:
+            await self._ensure_deps()
             process = subprocess.Popen([
-                "node", str(self.scripts_dir / "automation.js"), "monitor"
+                "node", self._automation_js_path, "monitor"
             ], cwd=self.base_dir)
             
             return process
@@ -535,27 +1153,80 @@ module.exports = AIAutomation;
             self.logger.error(f"❌ Monitoring start error: {e}")
             return None
     
-    async def run_ai_analysis(self):
+    async def run_ai_analysis(self) -> bool:
         """Run AI-powered analysis"""
         self.logger.info("🧠 Running AI analysis...")
         
         try:
-            result = subprocess.run([
-                "node", str(self.scripts_dir / "automation.js"), "ai"
-            ], cwd=self.base_dir, capture_output=True, text=True, timeout=180)
+            analysis = await self._rpc("ai", timeout=180)
             
-            if result.returncode == 0:
+            if analysis is not None:
                 self.logger.info("✅ AI analysis completed")
                 return True
             else:
-                self.logger.error(f"❌ AI analysis failed: {result.stderr}")
+                self.logger.error("❌ AI analysis failed: no analysis returned")
                 return False
                 
         except Exception as e:
             self.logger.error(f"❌ AI analysis error: {e}")
             return False
     
-    def run_interactive_mode(self):
+    async def run_command(self, *cmd: str) -> int:
+        """Run a command on this terminal (inherited stdio keeps its TTY, colours and prompts)"""
+        process = await asyncio.create_subprocess_exec(*cmd, cwd=self.base_dir)
+        
+        try:
+            return await process.wait()
+        except asyncio.CancelledError:
+            process.terminate()
+            await process.wait()
+            raise
+    
+    async def run_node_script(self, script: str, command: str) -> int:
+        """Run one of the Node automation scripts"""
+        return await self.run_command("node", str(self.scripts_dir / script), command)
+    
+    async def update_dependencies(self) -> None:
+        """Reinstall Node dependencies and refresh the install stamp"""
+        print("📦 Installing/Updating Dependencies...")
+        returncode = await self.run_command("npm", "install")
+        if returncode == 0:
+            self._write_deps_stamp()
+            self._deps_ready = True
+            print("✅ Dependencies updated successfully")
+        else:
+            print(f"❌ Failed to update dependencies: npm exited with {returncode}")
+    
+    async def start_dashboard(self) -> None:
+        """Run the AI dashboard and orchestrator"""
+        print("🚀 Starting AI Dashboard & Orchestrator...")
+        print("📊 Dashboard will be available at automation_logs/dashboard.html")
+        print("🌐 WebSocket server will run on port 8444")
+        print("⚠️ Press Ctrl+C to stop the orchestrator")
+        await self.run_node_script("orchestrator_fixed.js", "dashboard")
+    
+    async def run_full_suite(self) -> None:
+        """Run every advanced automation suite"""
+        print("🚀 Running Complete AI Suite...")
+        await self.run_node_script("advanced_ai_automation.js", "all")
+    
+    async def generate_report(self) -> None:
+        """Generate the orchestrator's comprehensive report"""
+        print("📊 Generating Comprehensive Report...")
+        await self.run_node_script("orchestrator_fixed.js", "report")
+    
+    async def select_command(self) -> Optional[str]:
+        """Prompt for the next interactive command"""
+        if questionary:
+            choices = [questionary.Choice(label, value=command) for _, label, command in MENU_OPTIONS]
+            return await questionary.select("Select option:", choices=choices).ask_async()
+        
+        # Read the prompt off-loop so the worker and child output keep flowing
+        print(MENU_TEXT)
+        key = (await asyncio.to_thread(input, "\nSelect option (0-9): ")).strip()
+        return next((command for k, _, command in MENU_OPTIONS if k == key), "")
+    
+    async def run_interactive_mode(self) -> None:
         """Run interactive automation mode"""
         print("🤖 AI Automation Engine - Interactive Mode")
         print("=" * 50)
@@ -563,66 +1234,60 @@ module.exports = AIAutomation;
         print("📊 Real-time dashboard available at automation_logs/dashboard.html")
         print("")
         
+        advanced = "advanced_ai_automation.js"
+        handlers = {
+            "health": self.run_health_check,
+            "security": lambda: self.run_node_script(advanced, "security"),
+            "performance": lambda: self.run_node_script(advanced, "performance"),
+            "content": lambda: self.run_node_script(advanced, "content"),
+            "visual": lambda: self.run_node_script(advanced, "visual"),
+            "dashboard": self.start_dashboard,
+            "all": self.run_full_suite,
+            "report": self.generate_report,
+            "install": self.update_dependencies,
+        }
+        
         while True:
-            print("\nAvailable commands:")
-            print("1. Health Check")
-            print("2. Security Scan (Advanced)")
-            print("3. Performance Test (with Core Web Vitals)")
-            print("4. AI Content Analysis")
-            print("5. Visual Regression Test")
-            print("6. Start AI Dashboard & Orchestrator")
-            print("7. Run Complete AI Suite")
-            print("8. Generate Report")
-            print("9. Install/Update Dependencies")
-            print("0. Exit")
-            
-            choice = input("\nSelect option (0-9): ").strip()
-            
-            if choice == "1":
-                asyncio.run(self.run_health_check())
-            elif choice == "2":
-                subprocess.run(["node", str(self.scripts_dir / "advanced_ai_automation.js"), "security"], cwd=self.base_dir)
-            elif choice == "3":
-                subprocess.run(["node", str(self.scripts_dir / "advanced_ai_automation.js"), "performance"], cwd=self.base_dir)
-            elif choice == "4":
-                subprocess.run(["node", str(self.scripts_dir / "advanced_ai_automation.js"), "content"], cwd=self.base_dir)
-            elif choice == "5":
-                subprocess.run(["node", str(self.scripts_dir / "advanced_ai_automation.js"), "visual"], cwd=self.base_dir)
-            elif choice == "6":
-                print("🚀 Starting AI Dashboard & Orchestrator...")
-                print("📊 Dashboard will be available at automation_logs/dashboard.html")
-                print("🌐 WebSocket server will run on port 8444")
-                print("⚠️ Press Ctrl+C to stop the orchestrator")
-                subprocess.run(["node", str(self.scripts_dir / "orchestrator_fixed.js"), "dashboard"], cwd=self.base_dir)
-            elif choice == "7":
-                print("🚀 Running Complete AI Suite...")
-                subprocess.run(["node", str(self.scripts_dir / "advanced_ai_automation.js"), "all"], cwd=self.base_dir)
-            elif choice == "8":
-                print("📊 Generating Comprehensive Report...")
-                subprocess.run(["node", str(self.scripts_dir / "orchestrator_fixed.js"), "report"], cwd=self.base_dir)
-            elif choice == "9":
-                print("📦 Installing/Updating Dependencies...")
-                try:
-                    subprocess.run(["npm", "install"], cwd=self.base_dir, check=True)
-                    print("✅ Dependencies updated successfully")
-                except subprocess.CalledProcessError as e:
-                    print(f"❌ Failed to update dependencies: {e}")
-            elif choice == "0":
+            command = await self.select_command()
+            
+            # questionary returns None when the prompt is cancelled
+            if command is None or command == "exit":
                 print("👋 Goodbye!")
                 break
-            else:
+            
+            handler = handlers.get(command)
+            if not handler:
                 print("❌ Invalid choice")
+                continue
+            
+            if command in NODE_COMMANDS:
+                await self._ensure_deps()
+            await handler()
         
         print("\n🎉 Thank you for using AI Automation Engine!")
         print("📚 Documentation: AI_AUTOMATION_README.md")
         print("🚀 Quick start: Use start_ai_automation.bat or start_ai_automation.ps1")
 
-
-async def main():
+async def main() -> None:
     engine = AIAutomationEngine()
     engine.create_automation_scripts()
-    engine.run_interactive_mode()
+    try:
+        await engine.run_interactive_mode()
+    finally:
+        await engine.close()
+
+
+def install_event_loop() -> None:
+    """Use uvloop when available, keeping the default loop on Windows"""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
 
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main())
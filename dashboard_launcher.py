@@ -5,24 +5,31 @@ Launch multiple monitoring dashboards simultaneously
 """
 
 import asyncio
+import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
-from rich.console import Console
+from typing import List
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.columns import Columns
 from rich.text import Text
 
+from ai_automation import install_event_loop
+
+# Where the network analyzer writes when it cannot have a terminal of its own
+ANALYZER_LOG = "network_analyzer.log"
+
 
 class DashboardLauncher:
-    def __init__(self):
-        self.console = Console()
-        self.dashboards = []
+    def __init__(self) -> None:
+        self.console: Console = Console()
+        self.dashboards: List[asyncio.subprocess.Process] = []
+        self._menu = self.build_menu()
     
-    def show_menu(self):
-        """Show dashboard selection menu"""
-        self.console.clear()
-        
+    def build_menu(self) -> Group:
+        """Build the dashboard selection menu once"""
         title = Panel(
             Text("🛡️ ArtifactVirtual Security Dashboard Suite 🛡️", 
                  style="bold white on blue", justify="center"),
@@ -39,13 +46,17 @@ class DashboardLauncher:
             Panel("4️⃣  Exit", title="Quit", border_style="red")
         ]
         
-        self.console.print(title)
-        self.console.print(Columns(options, equal=True, expand=True))
+        return Group(title, Columns(options, equal=True, expand=True))
+    
+    def show_menu(self) -> str:
+        """Show dashboard selection menu"""
+        self.console.clear()
+        self.console.print(self._menu)
         
         choice = self.console.input("\n[bold yellow]Select dashboard (1-4): [/bold yellow]")
         return choice
     
-    async def launch_security_monitor(self):
+    async def launch_security_monitor(self) -> None:
         """Launch security monitoring dashboard"""
         self.console.print("[green]🚀 Launching Security Monitor...[/green]")
         try:
@@ -55,7 +66,7 @@ class DashboardLauncher:
         except ImportError:
             self.console.print("[red]❌ Security monitor not found[/red]")
     
-    async def launch_network_analyzer(self):
+    async def launch_network_analyzer(self) -> None:
         """Launch network analysis dashboard"""
         self.console.print("[cyan]🚀 Launching Network Analyzer...[/cyan]")
         try:
@@ -65,22 +76,56 @@ class DashboardLauncher:
         except ImportError:
             self.console.print("[red]❌ Network analyzer not found[/red]")
     
-    async def launch_combined_dashboard(self):
+    async def launch_combined_dashboard(self) -> None:
         """Launch combined dashboard view"""
         self.console.print("[magenta]🚀 Launching Combined Dashboard...[/magenta]")
         
-        # Create tasks for both dashboards
-        tasks = [
-            asyncio.create_task(self.launch_security_monitor()),
-            asyncio.create_task(self.launch_network_analyzer())
-        ]
+        # Each dashboard runs in its own interpreter with its own event loop,
+        # so a slow collector in one cannot stall the other. Both draw
+        # full-screen Live views, so only the security monitor gets this
+        # terminal; the network analyzer gets its own tmux pane when we are
+        # inside tmux, otherwise it runs headless with output to a log file.
+        base_dir = Path(__file__).parent
+        pane = None
+        if os.environ.get("TMUX"):
+            split = await asyncio.create_subprocess_exec(
+                "tmux", "split-window", "-h", "-d", "-P", "-F", "#{pane_id}",
+                "-c", str(base_dir), f"{shlex.quote(sys.executable)} -m network_analyzer",
+                stdout=subprocess.PIPE
+            )
+            output, _ = await split.communicate()
+            pane = output.decode().strip() or None
+        
+        log = None
+        if pane is None:
+            log_path = base_dir / ANALYZER_LOG
+            self.console.print(f"[yellow]⚠️ Network analyzer needs its own terminal, logging to {log_path}[/yellow]")
+            log = open(log_path, "ab")
+            self.dashboards.append(await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "network_analyzer", cwd=base_dir,
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT
+            ))
+        self.dashboards.append(await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "security_monitor", cwd=base_dir
+        ))
         
         try:
-            await asyncio.gather(*tasks)
+            # The foreground monitor decides how long the combined view lasts
+            await self.dashboards[-1].wait()
         except KeyboardInterrupt:
             self.console.print("[yellow]Dashboard suite stopped[/yellow]")
+        finally:
+            for process in self.dashboards:
+                if process.returncode is None:
+                    process.terminate()
+                    await process.wait()
+            self.dashboards.clear()
+            if log is not None:
+                log.close()
+            if pane is not None:
+                await (await asyncio.create_subprocess_exec("tmux", "kill-pane", "-t", pane)).wait()
     
-    async def run(self):
+    async def run(self) -> None:
         """Main launcher loop"""
         while True:
             try:
@@ -104,10 +149,11 @@ class DashboardLauncher:
                 break
 
 
-async def main():
+async def main() -> None:
     launcher = DashboardLauncher()
     await launcher.run()
 
 
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main())
@@ -4,136 +4,51 @@ ArtifactVirtual.com - One-Click Deployment
 Complete setup and launch in a single command
 """
 
+import functools
+import gzip
 import os
 import sys
 import platform
+import signal
+import socket
 import subprocess
+import time
 import urllib.request
 import zipfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import urllib3
+    from urllib3.util.retry import Retry
+    HTTP_POOL = urllib3.PoolManager(num_pools=4, maxsize=10, retries=Retry(3, backoff_factor=0.3))
+except ImportError:
+    HTTP_POOL = None
 
-def print_banner():
-    """Print startup banner"""
-    print("🚀 ArtifactVirtual.com - One-Click Deployment")
-    print("=" * 60)
-    print("🎯 Self-contained • Docker-free • Production-ready")
-    print("🛡️  Security hardened • AI/ML optimized • Quantum ready")
-    print("=" * 60)
-
-
-def check_python():
-    """Check Python version"""
-    version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("❌ Python 3.8+ required")
-        print(f"   Current version: {version.major}.{version.minor}")
-        return False
-    print(f"✅ Python {version.major}.{version.minor} detected")
-    return True
-
-
-def setup_directories():
-    """Create required directory structure"""
-    dirs = [
-        "config", "nginx", "www/html", "ssl/certs", 
-        "logs", "monitor", "scripts"
-    ]
-    
-    base_dir = Path(__file__).parent
-    for dir_name in dirs:
-        dir_path = base_dir / dir_name
-        dir_path.mkdir(parents=True, exist_ok=True)
-    
-    print("📁 Directory structure created")
+# Read/write block size for downloads
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
+# Per-invocation apt settings (nothing is written to /etc/apt)
+APT_OPTIONS = (
+    "-o", "Acquire::http::Pipeline-Depth=5",
+    "-o", "Acquire::http::Keep-Alive=true",
+    "-o", "APT::Install-Recommends=false",
+)
 
-def download_nginx_windows():
-    """Download Nginx for Windows"""
-    nginx_exe = Path("nginx/nginx.exe")
-    if nginx_exe.exists():
-        print("✅ Nginx already present")
-        return True
-    
-    print("📥 Downloading Nginx for Windows...")
-    
-    try:
-        url = "https://nginx.org/download/nginx-1.24.0.zip"
-        zip_file = "nginx-temp.zip"
-        
-        urllib.request.urlretrieve(url, zip_file)
-        
-        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-            zip_ref.extractall("temp")
-        
-        # Move files
-        temp_dir = Path("temp/nginx-1.24.0")
-        nginx_dir = Path("nginx")
-        
-        for item in temp_dir.iterdir():
-            if item.is_file():
-                shutil.copy2(item, nginx_dir)
-            elif item.name in ["conf", "html", "logs"]:
-                shutil.copytree(item, nginx_dir / item.name, dirs_exist_ok=True)
-        
-        # Cleanup
-        shutil.rmtree("temp", ignore_errors=True)
-        Path(zip_file).unlink(missing_ok=True)
-        
-        print("✅ Nginx installed")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Failed to download Nginx: {e}")
-        return False
+# Delays between nginx startup checks (about 1.3s in total)
+STARTUP_BACKOFF = (0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64)
 
+# Copy buffer for zip extraction
+EXTRACT_CHUNK_SIZE = 32 * 1024
 
-def setup_nginx_linux():
-    """Setup Nginx for Linux"""
-    nginx_bin = Path("nginx/nginx")
-    if nginx_bin.exists():
-        print("✅ Nginx already present")
-        return True
-    
-    # Try system nginx first
-    system_nginx = shutil.which("nginx")
-    if system_nginx:
-        shutil.copy2(system_nginx, nginx_bin)
-        os.chmod(nginx_bin, 0o755)
-        print("✅ Using system Nginx")
-        return True
-    
-    # Try package manager
-    print("📦 Installing Nginx...")
-    try:
-        if shutil.which("apt-get"):
-            subprocess.run(["sudo", "apt-get", "update"], check=True, capture_output=True)
-            subprocess.run(["sudo", "apt-get", "install", "-y", "nginx-core"], check=True, capture_output=True)
-        elif shutil.which("yum"):
-            subprocess.run(["sudo", "yum", "install", "-y", "nginx"], check=True, capture_output=True)
-        elif shutil.which("dnf"):
-            subprocess.run(["sudo", "dnf", "install", "-y", "nginx"], check=True, capture_output=True)
-        
-        system_nginx = shutil.which("nginx") or "/usr/sbin/nginx"
-        if Path(system_nginx).exists():
-            shutil.copy2(system_nginx, nginx_bin)
-            os.chmod(nginx_bin, 0o755)
-            print("✅ Nginx installed")
-            return True
-            
-    except subprocess.CalledProcessError:
-        pass
-    
-    print("❌ Failed to install Nginx")
-    return False
+# Directories taken from the nginx Windows release
+NGINX_RUNTIME_DIRS = {"conf", "html", "logs"}
 
 
-def create_configs():
-    """Create configuration files"""
-    
-    # Nginx config
-    nginx_config = '''
+# Generated files, encoded once at import
+NGINX_CONFIG = '''
 worker_processes auto;
 error_log logs/error.log warn;
 pid logs/nginx.pid;
@@ -152,6 +67,8 @@ http {
     access_log logs/access.log main;
     
     sendfile on;
+    tcp_nopush on;
+    tcp_nodelay on;
     keepalive_timeout 65;
     client_max_body_size 100M;
     
@@ -160,10 +77,26 @@ http {
     add_header X-Content-Type-Options "nosniff" always;
     add_header X-XSS-Protection "1; mode=block" always;
     
-    # Gzip compression
+    # Cache open file descriptors and stat() results
+    open_file_cache max=10000 inactive=60s;
+    open_file_cache_valid 30s;
+    open_file_cache_min_uses 2;
+    open_file_cache_errors on;
+    
+    # Gzip compression (pre-compressed .gz files are served as-is)
     gzip on;
+    gzip_static on;
+    gzip_comp_level 5;
+    gzip_min_length 1024;
+    gzip_vary on;
     gzip_types text/plain text/css application/json application/javascript;
     
+    # Response cache for proxied backends (unused until a location proxies)
+    proxy_cache_path cache/proxy levels=1:2 keys_zone=app_cache:10m max_size=1g inactive=60m use_temp_path=off;
+    proxy_cache_key "$scheme$request_method$host$request_uri";
+    proxy_cache_lock on;
+    proxy_cache_use_stale error timeout updating http_500 http_502 http_503 http_504;
+    
     server {
         listen 8080;
         server_name localhost;
@@ -172,6 +105,12 @@ http {
         
         location / {
             try_files $uri $uri/ /index.html;
+            
+            # add_header here replaces the http-level set, so repeat it
+            add_header Cache-Control "public, max-age=3600" always;
+            add_header X-Frame-Options "SAMEORIGIN" always;
+            add_header X-Content-Type-Options "nosniff" always;
+            add_header X-XSS-Protection "1; mode=block" always;
         }
         
         location /health {
@@ -181,12 +120,9 @@ http {
         }
     }
 }
-'''.strip()
-    
-    Path("config/nginx.conf").write_text(nginx_config)
-    
-    # MIME types
-    mime_types = '''
+'''.strip().encode()
+
+MIME_TYPES = '''
 types {
     text/html                             html htm shtml;
     text/css                              css;
@@ -197,16 +133,9 @@ types {
     image/gif                             gif;
     image/svg+xml                         svg;
 }
-'''.strip()
-    
-    Path("nginx/mime.types").write_text(mime_types)
-    
-    print("✅ Configuration files created")
+'''.strip().encode()
 
-
-def create_landing_page():
-    """Create landing page"""
-    html_content = '''<!DOCTYPE html>
+INDEX_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -273,12 +202,255 @@ def create_landing_page():
         }, 1000);
     </script>
 </body>
-</html>'''
+</html>'''.encode()
+
+
+def write_file(path, payload):
+    """Write pre-encoded bytes with a single open/write/close"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def print_banner():
+    """Print startup banner"""
+    print("🚀 ArtifactVirtual.com - One-Click Deployment")
+    print("=" * 60)
+    print("🎯 Self-contained • Docker-free • Production-ready")
+    print("🛡️  Security hardened • AI/ML optimized • Quantum ready")
+    print("=" * 60)
+
+
+def check_python():
+    """Check Python version"""
+    version = sys.version_info
+    if version.major < 3 or (version.major == 3 and version.minor < 8):
+        print("❌ Python 3.8+ required")
+        print(f"   Current version: {version.major}.{version.minor}")
+        return False
+    print(f"✅ Python {version.major}.{version.minor} detected")
+    return True
+
+
+def setup_directories():
+    """Create required directory structure"""
+    dirs = [
+        "config", "nginx", "www/html", "ssl/certs", 
+        "logs", "monitor", "scripts", "cache/proxy"
+    ]
+    
+    base_dir = Path(__file__).parent
+    for dir_name in dirs:
+        dir_path = base_dir / dir_name
+        dir_path.mkdir(parents=True, exist_ok=True)
+    
+    print("📁 Directory structure created")
+
+
+def download_file(url, destination):
+    """Stream a URL to disk in large blocks over a pooled connection"""
+    if HTTP_POOL is None:
+        with urllib.request.urlopen(url) as response, open(destination, 'wb') as f:
+            shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+        return
+    
+    response = HTTP_POOL.request('GET', url, preload_content=False)
+    try:
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status} fetching {url}")
+        with open(destination, 'wb') as f:
+            shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+    finally:
+        response.release_conn()
+
+
+def nginx_member_path(name, nginx_dir):
+    """Map a release zip entry into nginx/, or None for parts we don't ship"""
+    parts = name.split('/', 1)
+    if len(parts) < 2 or not parts[1]:
+        return None
+    
+    rel = parts[1].replace('\\', '/')
+    # Zip-slip: nothing absolute, no drive letters, no ".." components
+    if rel.startswith('/') or ':' in rel or '..' in rel.split('/'):
+        return None
+    
+    # Top-level files (nginx.exe, licences) plus the runtime directories
+    if '/' in rel and rel.split('/', 1)[0] not in NGINX_RUNTIME_DIRS:
+        return None
     
-    Path("www/html/index.html").write_text(html_content)
+    return nginx_dir / rel
+
+
+def extract_nginx_zip(zip_file, nginx_dir):
+    """Extract the nginx release straight into nginx/, files in parallel"""
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        members = []
+        for info in zip_ref.infolist():
+            target = nginx_member_path(info.filename, nginx_dir)
+            if target is None:
+                continue
+            
+            # Directories are created up front so workers only write files
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                members.append((info, target))
+    
+    # ZipFile reads are not thread-safe: each worker gets its own handle and buffer
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+    
+    def extract_one(member):
+        info, target = member
+        if not hasattr(local, "zip_ref"):
+            local.zip_ref = zipfile.ZipFile(zip_file, 'r')
+            local.buffer = memoryview(bytearray(EXTRACT_CHUNK_SIZE))
+            with handles_lock:
+                handles.append(local.zip_ref)
+        
+        with local.zip_ref.open(info) as src, open(target, 'wb') as dst:
+            while True:
+                n = src.readinto(local.buffer)
+                if not n:
+                    break
+                dst.write(local.buffer[:n])
+    
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(extract_one, members))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def download_nginx_windows():
+    """Download Nginx for Windows"""
+    nginx_exe = Path("nginx/nginx.exe")
+    if nginx_exe.exists():
+        print("✅ Nginx already present")
+        return True
+    
+    print("📥 Downloading Nginx for Windows...")
+    
+    try:
+        url = "https://nginx.org/download/nginx-1.24.0.zip"
+        zip_file = "nginx-temp.zip"
+        
+        download_file(url, zip_file)
+        
+        extract_nginx_zip(zip_file, Path("nginx"))
+        
+        # Cleanup
+        Path(zip_file).unlink(missing_ok=True)
+        
+        print("✅ Nginx installed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Failed to download Nginx: {e}")
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name):
+    """shutil.which, walking PATH once per name (same helper as setup.py)"""
+    return shutil.which(name)
+
+
+def link_binary(source, target):
+    """Point target at source: hardlink, else symlink, else copy"""
+    try:
+        os.link(source, target)
+        return
+    except OSError:
+        pass
+    
+    # Cross-device or protected_hardlinks: a symlink still avoids the copy
+    try:
+        os.symlink(source, target)
+        return
+    except OSError:
+        pass
+    
+    shutil.copy2(source, target)
+    os.chmod(target, 0o755)
+
+
+def setup_nginx_linux():
+    """Setup Nginx for Linux"""
+    nginx_bin = Path("nginx/nginx")
+    if nginx_bin.exists():
+        print("✅ Nginx already present")
+        return True
+    
+    # Try system nginx first
+    system_nginx = find_executable("nginx")
+    if system_nginx:
+        link_binary(system_nginx, nginx_bin)
+        print("✅ Using system Nginx")
+        return True
+    
+    # Try package manager
+    print("📦 Installing Nginx...")
+    try:
+        if find_executable("apt-get"):
+            # apt-fast parallelises downloads when installed; either way, pipeline
+            # requests over keep-alive connections and skip recommended packages
+            apt = "apt-fast" if find_executable("apt-fast") else "apt-get"
+            subprocess.run(["sudo", "apt-get", *APT_OPTIONS, "update"], check=True, capture_output=True)
+            subprocess.run(
+                ["sudo", apt, *APT_OPTIONS, "install", "-y", "--no-install-recommends", "nginx-core"],
+                check=True, capture_output=True
+            )
+        elif find_executable("yum"):
+            subprocess.run(["sudo", "yum", "install", "-y", "nginx"], check=True, capture_output=True)
+        elif find_executable("dnf"):
+            subprocess.run(["sudo", "dnf", "install", "-y", "nginx"], check=True, capture_output=True)
+        
+        # The package manager just added nginx, so look it up again
+        find_executable.cache_clear()
+        system_nginx = find_executable("nginx") or "/usr/sbin/nginx"
+        if Path(system_nginx).exists():
+            link_binary(system_nginx, nginx_bin)
+            print("✅ Nginx installed")
+            return True
+            
+    except subprocess.CalledProcessError:
+        pass
+    
+    print("❌ Failed to install Nginx")
+    return False
+
+
+def create_configs():
+    """Create configuration files"""
+    write_file("config/nginx.conf", NGINX_CONFIG)
+    write_file("nginx/mime.types", MIME_TYPES)
+    
+    print("✅ Configuration files created")
+
+
+def create_landing_page():
+    """Create landing page"""
+    write_file("www/html/index.html", INDEX_HTML)
+    write_file("www/html/index.html.gz", gzip.compress(INDEX_HTML, 9))
     print("✅ Landing page created")
 
 
+def port_open(host, port):
+    """True when something accepts TCP connections on host:port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex((host, port)) == 0
+
+
 def start_server():
     """Start the Nginx server"""
     system = platform.system().lower()
@@ -295,11 +467,16 @@ def start_server():
         # Start nginx
         process = subprocess.Popen(nginx_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
-        # Give it a moment to start
-        import time
-        time.sleep(2)
+        # Poll with backoff until nginx listens or exits, instead of a fixed 2s wait
+        for delay in STARTUP_BACKOFF:
+            time.sleep(delay)
+            if process.poll() is not None or port_open("localhost", 8080):
+                break
         
-        if process.poll() is None:
+        # A non-zero exit (e.g. bind() failed with EADDRINUSE) is a failure even if
+        # something else already listens on 8080; 0 is nginx daemonizing itself
+        returncode = process.poll()
+        if returncode is None or (returncode == 0 and port_open("localhost", 8080)):
             print("✅ Server started successfully!")
             print()
             print("🌐 Server URLs:")
@@ -320,14 +497,20 @@ def start_server():
             print("Press Ctrl+C to continue...")
             
             try:
-                while True:
-                    time.sleep(1)
+                # Sleep in the kernel until nginx exits or Ctrl+C arrives
+                if process.poll() is None:
+                    process.wait()
+                elif hasattr(signal, "pause"):
+                    signal.pause()
+                else:
+                    while True:
+                        time.sleep(3600)
             except KeyboardInterrupt:
                 print("\n👋 Deployment complete!")
                 
         else:
             stdout, stderr = process.communicate()
-            print(f"❌ Server failed to start")
+            print(f"❌ Server failed to start (exit code {process.returncode})")
             if stderr:
                 print(f"Error: {stderr.decode()}")
             return False
@@ -4,11 +4,95 @@ Unified Deployment Script
 Docker-free, self-contained deployment with AI automation
 """
 
+import os
+import signal
+import socket
 import subprocess
 import sys
 import time
 from pathlib import Path
 
+try:
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    HTTP_POOL = urllib3.PoolManager(cert_reqs='CERT_NONE', maxsize=10, retries=False)
+except ImportError:
+    HTTP_POOL = None
+
+HEALTH_URL = "https://localhost:8443/health"
+WEB_PORT = 8443
+
+# Seconds a service gets to shut down cleanly (portable_server waits up to 10s on nginx)
+STOP_TIMEOUT = 15
+
+
+def health_status():
+    """HTTP status of the local health endpoint (self-signed cert accepted)"""
+    if HTTP_POOL is None:
+        import ssl
+        import urllib.error
+        import urllib.request
+        try:
+            with urllib.request.urlopen(HEALTH_URL, timeout=10, context=ssl._create_unverified_context()) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+    
+    return HTTP_POOL.request('GET', HEALTH_URL, timeout=10).status
+
+
+def start_service(script, base_dir, detach=False):
+    """Start a service script; detached services get their own process group"""
+    # Interactive services must stay in the terminal's foreground group to read input
+    if detach and os.name == "posix":
+        return subprocess.Popen([sys.executable, script], cwd=base_dir, start_new_session=True)
+    return subprocess.Popen([sys.executable, script], cwd=base_dir)
+
+
+def wait_for_port(host, port, timeout, process=None):
+    """Wait until host:port accepts connections, the process exits, or timeout passes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            if sock.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(0.05)
+    return False
+
+
+def stop_services(processes):
+    """SIGTERM each service so its own shutdown runs, then sweep its process group"""
+    # nginx daemonizes into its own session, so no group kill reaches it;
+    # portable_server's SIGTERM handler stops it via the pid file instead
+    groups = []
+    for process in processes:
+        if process.poll() is not None:
+            continue
+        try:
+            # Detached services lead their own group (see start_service)
+            if os.name == "posix" and os.getpgid(process.pid) == process.pid:
+                groups.append(process.pid)
+            process.terminate()
+        except ProcessLookupError:
+            pass
+    
+    for process in processes:
+        try:
+            process.wait(timeout=STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    
+    # Only once the services have shut down: reap helpers they left behind
+    for pgid in groups:
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
 
 def main():
     print("🚀 Reverse Ingress-Nginx Infrastructure Suite")
@@ -41,19 +125,22 @@ def main():
     elif choice == "4":
         print("\n🔧 Full Stack Deployment...")
         
-        # Start web server in background
+        # Start web server in background and continue once it is listening
         print("Starting web server...")
-        web_process = subprocess.Popen([sys.executable, "portable_server.py"], cwd=base_dir)
-        time.sleep(5)
+        web_process = start_service("portable_server.py", base_dir, detach=True)
+        if wait_for_port("localhost", WEB_PORT, timeout=15, process=web_process):
+            print(f"✅ Web server listening on port {WEB_PORT}")
+        else:
+            print(f"⚠️ Web server not listening on port {WEB_PORT} yet, continuing")
         
-        # Start dashboard in background
+        # The dashboard and automation engine have no port to probe
         print("Starting security dashboard...")
-        dashboard_process = subprocess.Popen([sys.executable, "dashboard_launcher.py"], cwd=base_dir)
-        time.sleep(3)
+        dashboard_process = start_service("dashboard_launcher.py", base_dir)
         
-        # Start AI automation
         print("Starting AI automation...")
-        automation_process = subprocess.Popen([sys.executable, "ai_automation.py"], cwd=base_dir)
+        automation_process = start_service("ai_automation.py", base_dir)
+        
+        processes = [web_process, dashboard_process, automation_process]
         
         print("\n✅ Full stack deployed!")
         print("🌐 Web: https://localhost:8443")
@@ -62,26 +149,21 @@ def main():
         print("\nPress Ctrl+C to stop all services...")
         
         try:
-            while True:
-                time.sleep(1)
+            for process in processes:
+                process.wait()
         except KeyboardInterrupt:
             print("\n🛑 Stopping all services...")
-            for process in [web_process, dashboard_process, automation_process]:
-                try:
-                    process.terminate()
-                    process.wait(timeout=5)
-                except:
-                    process.kill()
+        finally:
+            stop_services(processes)
         
     elif choice == "5":
         print("\n📱 Quick Health Check...")
         try:
-            import requests
-            response = requests.get("https://localhost:8443/health", verify=False, timeout=10)
-            if response.status_code == 200:
+            status = health_status()
+            if status == 200:
                 print("✅ Server is healthy!")
             else:
-                print(f"⚠️ Server returned status {response.status_code}")
+                print(f"⚠️ Server returned status {status}")
         except Exception as e:
             print(f"❌ Health check failed: {e}")
             print("💡 Try starting the server first (option 1)")
@@ -4,81 +4,170 @@ Advanced Network Traffic Analyzer
 Real-time network monitoring with packet analysis and threat detection
 """
 
+from __future__ import annotations
+
 import asyncio
-import time
-import json
+import heapq
 from datetime import datetime
-from typing import Dict, List, Set
-from collections import defaultdict, deque
-import subprocess
+from typing import TYPE_CHECKING, Dict
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from operator import itemgetter
 import re
 
-from rich.console import Console
-from rich.live import Live
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, BarColumn
-from rich.tree import Tree
-from rich import box
+# Rich is imported where it is used, so importing this module stays cheap
+if TYPE_CHECKING:
+    from rich.layout import Layout
+    from rich.panel import Panel
+
+
+# All attack signatures as one alternation, compiled once
+SUSPICIOUS_PATTERN = re.compile(
+    r'\.\./'            # Directory traversal
+    r'|<script'         # XSS attempts
+    r'|union.*select'   # SQL injection
+    r'|etc/passwd'      # File inclusion
+    r'|cmd='            # Command injection
+    r'|eval\('          # Code execution
+    r'|phpinfo'         # Info disclosure
+    r'|wp-admin',       # WordPress attacks
+    re.IGNORECASE
+)
+SUSPICIOUS_BYTES_PATTERN = re.compile(SUSPICIOUS_PATTERN.pattern.encode(), re.IGNORECASE)
+
+# Kernel socket tables of the nginx container's network namespace (tcp6 may be
+# absent when IPv6 is disabled), and the hex state codes we report
+PROC_TCP_SCRIPT = "cat /proc/net/tcp /proc/net/tcp6 2>/dev/null"
+TCP_STATES = {'01': 'established', '06': 'time_wait', '0A': 'listen'}
+
+# Traffic panel status column, keyed by HTTP status class
+STATUS_STYLES = {'2': "🟢 OK", '3': "🟢 OK", '4': "🟡 WARN", '5': "🔴 ERROR"}
+
+# Caps on per-analysis and per-key history so long runs keep a fixed working set
+SUSPICIOUS_ACTIVITY_LIMIT = 512
+REQUEST_PATTERN_HISTORY = 256
+
+# Longest access log line accepted from the tail pipe
+LOG_LINE_LIMIT = 1024 * 1024
+
+# Combined log format: whole line, remote_addr and status
+LOG_LINE_PATTERN = re.compile(rb'^((\S+) \S+ \S+ \[[^\]]+\] "[^"]*" (\d{3})[^\n]*)', re.MULTILINE)
+
+
+def parse_proc_connections(text: str) -> Dict:
+    """Count TCP sockets by state and local port from /proc/net/tcp-format text"""
+    connections = {
+        'total': 0,
+        'established': 0,
+        'time_wait': 0,
+        'listen': 0,
+        'by_port': defaultdict(int)
+    }
+    
+    for line in text.splitlines():
+        fields = line.split()
+        # Skip the "sl local_address ..." header of each table
+        if len(fields) < 4 or fields[0] == 'sl':
+            continue
+        
+        connections['total'] += 1
+        state = TCP_STATES.get(fields[3])
+        if state:
+            connections[state] += 1
+        
+        # local_address is HEXIP:HEXPORT
+        port = str(int(fields[1].rsplit(':', 1)[1], 16))
+        connections['by_port'][port] += 1
+    
+    return connections
 
 
 class NetworkAnalyzer:
     def __init__(self):
+        from rich.console import Console
         self.console = Console()
         self.connections = defaultdict(int)
         self.traffic_history = deque(maxlen=100)
         self.suspicious_patterns = set()
         self.blocked_ips = set()
         self.connection_counts = defaultdict(int)
-        self.request_patterns = defaultdict(list)
+        self.request_patterns = defaultdict(lambda: deque(maxlen=REQUEST_PATTERN_HISTORY))
+        
+        # Access log window, fed by one long-lived `tail -F` in the nginx container
+        self.log_lines = deque(maxlen=1000)
+        self._log_tail = None
+        self._log_reader = None
+        
+        # The threat panel is static; the small data tables are rebuilt each refresh
+        self._threat_panel = self.create_threat_intelligence_panel()
+        
+    async def start_log_tail(self):
+        """Follow the nginx access log with a persistent tail process"""
+        if self._log_tail and self._log_tail.returncode is None:
+            return
+        
+        self._log_tail = await asyncio.create_subprocess_exec(
+            "docker-compose", "exec", "-T", "nginx",
+            "tail", "-F", "-n", "1000", "/var/log/nginx/access.log",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=LOG_LINE_LIMIT
+        )
+        self._log_reader = asyncio.create_task(self.read_log_tail(self._log_tail))
+    
+    async def read_log_tail(self, process):
+        """Append followed log lines to the bounded window"""
+        try:
+            async for line in process.stdout:
+                self.log_lines.append(line)
+        except ValueError:
+            # Line longer than LOG_LINE_LIMIT; the tail is restarted next tick
+            process.kill()
+    
+    async def close(self):
+        """Stop the log tail process"""
+        if self._log_tail and self._log_tail.returncode is None:
+            self._log_tail.terminate()
+            await self._log_tail.wait()
+        if self._log_reader:
+            await self._log_reader
+            self._log_reader = None
         
     async def analyze_nginx_logs(self) -> Dict:
         """Analyze nginx access logs for patterns"""
         try:
             # Get recent nginx logs
-            result = subprocess.run([
-                "docker-compose", "exec", "-T", "nginx",
-                "tail", "-n", "1000", "/var/log/nginx/access.log"
-            ], capture_output=True, text=True, timeout=10)
+            await self.start_log_tail()
             
-            if not result.stdout:
+            if not self.log_lines:
                 return {}
+            log_buffer = b"".join(self.log_lines)
+            
+            # One regex pass over the raw buffer yields (line, ip, status) per entry
+            entries = LOG_LINE_PATTERN.findall(log_buffer)
+            timestamp = datetime.now().isoformat()
+            
+            status_codes = Counter(status for _, _, status in entries)
             
             analysis = {
-                'total_requests': 0,
-                'unique_ips': set(),
-                'status_codes': defaultdict(int),
-                'user_agents': defaultdict(int),
+                'total_requests': len(entries),
+                'unique_ips': len({ip for _, ip, _ in entries}),
+                'status_codes': Counter({status.decode(): count for status, count in status_codes.items()}),
+                'user_agents': Counter(),
                 'attack_patterns': [],
-                'top_endpoints': defaultdict(int),
-                'suspicious_activity': []
+                'top_endpoints': Counter(),
+                # Check for attack patterns
+                'suspicious_activity': deque((
+                    {
+                        'ip': ip.decode(errors='replace'),
+                        'timestamp': timestamp,
+                        'pattern': 'suspicious_request'
+                    }
+                    for line, ip, _ in entries
+                    if SUSPICIOUS_BYTES_PATTERN.search(line)
+                ), maxlen=SUSPICIOUS_ACTIVITY_LIMIT)
             }
             
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                    
-                # Parse nginx log line (simplified)
-                parts = line.split(' ')
-                if len(parts) >= 9:
-                    ip = parts[0]
-                    status = parts[8]
-                    
-                    analysis['total_requests'] += 1
-                    analysis['unique_ips'].add(ip)
-                    analysis['status_codes'][status] += 1
-                    
-                    # Check for attack patterns
-                    if self.is_suspicious_request(line):
-                        analysis['suspicious_activity'].append({
-                            'ip': ip,
-                            'timestamp': datetime.now().isoformat(),
-                            'pattern': 'suspicious_request'
-                        })
-            
-            analysis['unique_ips'] = len(analysis['unique_ips'])
             return analysis
             
         except Exception as e:
@@ -87,64 +176,38 @@ class NetworkAnalyzer:
     
     def is_suspicious_request(self, log_line: str) -> bool:
         """Check if request matches suspicious patterns"""
-        suspicious_patterns = [
-            r'\.\./',  # Directory traversal
-            r'<script',  # XSS attempts
-            r'union.*select',  # SQL injection
-            r'etc/passwd',  # File inclusion
-            r'cmd=',  # Command injection
-            r'eval\(',  # Code execution
-            r'phpinfo',  # Info disclosure
-            r'wp-admin',  # WordPress attacks
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, log_line, re.IGNORECASE):
-                return True
-        return False
+        return SUSPICIOUS_PATTERN.search(log_line) is not None
     
     async def get_active_connections(self) -> Dict:
         """Get active network connections"""
         try:
-            result = subprocess.run([
-                "docker-compose", "exec", "-T", "nginx",
-                "netstat", "-an"
-            ], capture_output=True, text=True, timeout=5)
-            
-            connections = {
-                'total': 0,
-                'established': 0,
-                'time_wait': 0,
-                'listen': 0,
-                'by_port': defaultdict(int)
-            }
-            
-            for line in result.stdout.split('\n'):
-                if 'tcp' in line:
-                    connections['total'] += 1
-                    if 'ESTABLISHED' in line:
-                        connections['established'] += 1
-                    elif 'TIME_WAIT' in line:
-                        connections['time_wait'] += 1
-                    elif 'LISTEN' in line:
-                        connections['listen'] += 1
-                        
-                    # Extract port
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        local_addr = parts[3]
-                        if ':' in local_addr:
-                            port = local_addr.split(':')[-1]
-                            connections['by_port'][port] += 1
-            
-            return connections
+            return parse_proc_connections(await self.read_container_proc_tcp())
             
         except Exception as e:
             self.console.print(f"[red]Error getting connections: {e}[/red]")
             return {}
     
+    async def read_container_proc_tcp(self) -> str:
+        """The nginx container's /proc/net/tcp and tcp6, read inside its network namespace"""
+        process = await asyncio.create_subprocess_exec(
+            "docker-compose", "exec", "-T", "nginx", "sh", "-c", PROC_TCP_SCRIPT,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        return stdout.decode(errors='replace')
+    
     def create_traffic_panel(self, log_analysis: Dict) -> Panel:
         """Create traffic analysis panel"""
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED)
         table.add_column("Metric", style="white", width=20)
         table.add_column("Value", style="green", width=15)
@@ -159,20 +222,22 @@ class NetworkAnalyzer:
         # Status codes
         status_codes = log_analysis.get('status_codes', {})
         for status, count in sorted(status_codes.items()):
-            status_style = "🟢 OK" if status.startswith('2') else "🟡 WARN" if status.startswith('4') else "🔴 ERROR"
-            table.add_row(f"HTTP {status}", str(count), status_style)
+            table.add_row(f"HTTP {status}", str(count), STATUS_STYLES.get(status[:1], "🔴 ERROR"))
         
         return Panel(table, title="🌐 Traffic Analysis", border_style="cyan")
     
     def create_security_analysis_panel(self, log_analysis: Dict) -> Panel:
         """Create security analysis panel"""
+        from rich.panel import Panel
+        from rich.tree import Tree
+        
         tree = Tree("🛡️ Security Analysis")
         
         # Suspicious activity
         suspicious = log_analysis.get('suspicious_activity', [])
         if suspicious:
             sus_branch = tree.add("🚨 Suspicious Activity")
-            for activity in suspicious[-10:]:  # Show last 10
+            for activity in islice(suspicious, max(len(suspicious) - 10, 0), None):  # Show last 10
                 sus_branch.add(f"IP: {activity['ip']} - {activity['pattern']}")
         else:
             tree.add("✅ No Suspicious Activity Detected")
@@ -196,6 +261,10 @@ class NetworkAnalyzer:
     
     def create_connections_panel(self, connections: Dict) -> Panel:
         """Create active connections panel"""
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
         table.add_column("Connection Type", style="cyan", width=18)
         table.add_column("Count", style="white", width=10)
@@ -216,13 +285,17 @@ class NetworkAnalyzer:
         if by_port:
             table.add_row("", "", "")
             table.add_row("Top Ports:", "", "")
-            for port, count in sorted(by_port.items(), key=lambda x: x[1], reverse=True)[:3]:
+            for port, count in heapq.nlargest(3, by_port.items(), key=itemgetter(1)):
                 table.add_row(f"Port {port}", str(count), "🟢 Active")
         
         return Panel(table, title="🔗 Active Connections", border_style="magenta")
     
     def create_threat_intelligence_panel(self) -> Panel:
         """Create threat intelligence panel"""
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         table = Table(show_header=True, header_style="bold red", box=box.ROUNDED)
         table.add_column("Threat Type", style="cyan", width=20)
         table.add_column("Risk Level", style="yellow", width=12)
@@ -239,6 +312,10 @@ class NetworkAnalyzer:
     
     def create_network_layout(self, log_analysis: Dict, connections: Dict) -> Layout:
         """Create network analyzer layout"""
+        from rich.layout import Layout
+        from rich.panel import Panel
+        from rich.text import Text
+        
         layout = Layout()
         
         # Header
@@ -265,33 +342,42 @@ class NetworkAnalyzer:
         
         layout["right"].split_column(
             Layout(self.create_security_analysis_panel(log_analysis)),
-            Layout(self.create_threat_intelligence_panel())
+            Layout(self._threat_panel)
         )
         
         return layout
     
     async def run_analyzer(self):
         """Run the network analyzer"""
+        from rich.layout import Layout
+        from rich.live import Live
+        
         self.console.print("[bold green]🚀 Starting Network Traffic Analyzer...[/bold green]")
         
-        with Live(Layout(), refresh_per_second=1, screen=True) as live:
-            while True:
-                try:
-                    # Collect network data
-                    log_analysis = await self.analyze_nginx_logs()
-                    connections = await self.get_active_connections()
-                    
-                    # Update display
-                    live.update(self.create_network_layout(log_analysis, connections))
-                    
-                    await asyncio.sleep(3)
-                    
-                except KeyboardInterrupt:
-                    self.console.print("[yellow]Network analyzer stopped[/yellow]")
-                    break
-                except Exception as e:
-                    self.console.print(f"[red]Analyzer error: {e}[/red]")
-                    await asyncio.sleep(2)
+        try:
+            # Data changes every 3s, so redraw on update instead of on a timer
+            with Live(Layout(), auto_refresh=False, screen=True) as live:
+                while True:
+                    try:
+                        # Collect network data
+                        log_analysis, connections = await asyncio.gather(
+                            self.analyze_nginx_logs(),
+                            self.get_active_connections()
+                        )
+                        
+                        # Update display
+                        live.update(self.create_network_layout(log_analysis, connections), refresh=True)
+                        
+                        await asyncio.sleep(3)
+                        
+                    except KeyboardInterrupt:
+                        self.console.print("[yellow]Network analyzer stopped[/yellow]")
+                        break
+                    except Exception as e:
+                        self.console.print(f"[red]Analyzer error: {e}[/red]")
+                        await asyncio.sleep(2)
+        finally:
+            await self.close()
 
 
 async def main():
@@ -4,95 +4,52 @@ Reverse Ingress-Nginx Infrastructure - Portable Server Launcher
 Self-contained, dependency-free web server with monitoring dashboard
 """
 
+import os
 import sys
+import asyncio
+import atexit
+import queue
+import gzip
+import importlib.util
 import time
 import signal
 import logging
 import platform
 import subprocess
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
 from pathlib import Path
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+except ImportError:
+    x509 = None
 
-class PortableServer:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent.absolute()
-        self.config_dir = self.base_dir / "config"
-        self.nginx_dir = self.base_dir / "nginx"
-        self.www_dir = self.base_dir / "www"
-        self.ssl_dir = self.base_dir / "ssl"
-        self.logs_dir = self.base_dir / "logs"
-        self.monitor_dir = self.base_dir / "monitor"
-        
-        self.nginx_process = None
-        self.monitor_process = None
-        self.is_running = False
-        
-        # Setup logging
-        self.setup_logging()
-        
-    def setup_logging(self):
-        """Setup logging configuration"""
-        self.logs_dir.mkdir(exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.logs_dir / 'server.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+# Seconds to wait for nginx to write its pidfile after start/reload
+PID_FILE_TIMEOUT = 2.0
 
-    def check_dependencies(self) -> bool:
-        """Check if all required files and directories exist"""
-        required_dirs = [
-            self.config_dir,
-            self.nginx_dir,
-            self.www_dir,
-            self.ssl_dir,
-            self.logs_dir
-        ]
-        
-        missing_dirs = []
-        for dir_path in required_dirs:
-            if not dir_path.exists():
-                missing_dirs.append(str(dir_path))
-        
-        if missing_dirs:
-            self.logger.error(f"Missing directories: {missing_dirs}")
-            self.logger.info("Run './setup.py' first to initialize the server")
-            return False
-        
-        # Check for nginx binary
-        nginx_binary = self.get_nginx_binary()
-        if not nginx_binary or not Path(nginx_binary).exists():
-            self.logger.error("Nginx binary not found")
-            return False
-            
-        return True
-
-    def get_nginx_binary(self) -> Optional[str]:
-        """Get the appropriate nginx binary for the current platform"""
-        system = platform.system().lower()
-        
-        if system == "windows":
-            return str(self.nginx_dir / "nginx.exe")
-        else:
-            return str(self.nginx_dir / "nginx")
+# Shared by the console and file handlers
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
-    def generate_nginx_config(self):
-        """Generate nginx configuration"""
-        config_content = f"""
+# nginx.conf template, rendered with PortableServer.nginx_config_values()
+NGINX_TEMPLATE = """
 # ArtifactVirtual.com - Portable Nginx Configuration
+{thread_pool}
 worker_processes auto;
-error_log {self.logs_dir}/error.log warn;
-pid {self.logs_dir}/nginx.pid;
+{cpu_affinity}
+error_log {logs_dir}/error.log warn;
+pid {pid_file};
+worker_rlimit_nofile 100000;
 
 events {{
-    worker_connections 1024;
-    use {'epoll' if platform.system() != 'Windows' else 'select'};
+    worker_connections 4000;
+    use {event_method};
+    {multi_accept}
+    {accept_mutex}
 }}
 
 http {{
@@ -104,7 +61,7 @@ http {{
                    '$status $body_bytes_sent "$http_referer" '
                    '"$http_user_agent" "$http_x_forwarded_for"';
     
-    access_log {self.logs_dir}/access.log main;
+    access_log {logs_dir}/access.log main buffer=64k flush=5s;
     
     # Performance
     sendfile on;
@@ -112,6 +69,15 @@ http {{
     tcp_nodelay on;
     keepalive_timeout 65;
     client_max_body_size 100M;
+    open_file_cache max=200000 inactive=20s;
+    open_file_cache_valid 30s;
+    open_file_cache_min_uses 2;
+    open_file_cache_errors on;
+    
+    # Async file I/O (large files bypass the page cache, the rest use sendfile)
+    {aio}
+    directio 4m;
+    output_buffers 2 1m;
     
     # Security Headers
     add_header X-Frame-Options "SAMEORIGIN" always;
@@ -120,31 +86,42 @@ http {{
     add_header Referrer-Policy "strict-origin-when-cross-origin" always;
     add_header Content-Security-Policy "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline';" always;
     
-    # Rate Limiting
-    limit_req_zone $binary_remote_addr zone=api:10m rate=10r/s;
-    limit_req_zone $binary_remote_addr zone=static:10m rate=50r/s;
+    # Rate Limiting: 64m zones hold ~1M client states before LRU eviction
+    # (zone "sync" is NGINX Plus only, so open source nginx keeps them per host)
+    limit_req_zone $binary_remote_addr zone=api:64m rate=10r/s;
+    limit_req_zone $binary_remote_addr zone=static:64m rate=50r/s;
+    limit_conn_zone $binary_remote_addr zone=conn:10m;
     
-    # Gzip Compression
+    # Gzip Compression (pre-compressed .gz files are served as-is)
     gzip on;
+    gzip_static on;
+    gunzip on;
     gzip_vary on;
     gzip_min_length 1024;
     gzip_types text/plain text/css text/xml text/javascript application/javascript application/xml+rss application/json;
     
     # Main Server Block
     server {{
-        listen 8080;
-        listen 8443 ssl http2;
+        listen 8080{reuseport};
+        listen 8443 ssl http2{reuseport};
         server_name localhost artifactvirtual.com;
         
-        root {self.www_dir}/html;
+        root {www_dir}/html;
         index index.html index.htm;
         
+        # Cap concurrent connections per client before any request is parsed;
+        # 100 is far above a browser's ~6-8 per host, so only floods hit it
+        limit_conn conn 100;
+        
         # SSL Configuration
-        ssl_certificate {self.ssl_dir}/certs/server.crt;
-        ssl_certificate_key {self.ssl_dir}/certs/server.key;
+        ssl_certificate {ssl_dir}/certs/server.crt;
+        ssl_certificate_key {ssl_dir}/certs/server.key;
         ssl_protocols TLSv1.2 TLSv1.3;
-        ssl_ciphers ECDHE-RSA-AES256-GCM-SHA512:DHE-RSA-AES256-GCM-SHA512:ECDHE-RSA-AES256-GCM-SHA384;
-        ssl_prefer_server_ciphers off;
+        ssl_ciphers ECDHE-ECDSA-AES128-GCM-SHA256:ECDHE-RSA-AES128-GCM-SHA256:ECDHE-ECDSA-CHACHA20-POLY1305:ECDHE-RSA-AES256-GCM-SHA384;
+        ssl_prefer_server_ciphers on;
+        ssl_session_cache shared:SSL:10m;
+        ssl_session_timeout 1d;
+        ssl_session_tickets on;
         
         # Static Files
         location / {{
@@ -184,49 +161,9 @@ http {{
     }}
 }}
 """
-        
-        config_file = self.config_dir / "nginx.conf"
-        config_file.write_text(config_content.strip())
-        self.logger.info(f"Generated nginx config: {config_file}")
 
-    def generate_ssl_certificates(self):
-        """Generate self-signed SSL certificates"""
-        cert_dir = self.ssl_dir / "certs"
-        cert_dir.mkdir(exist_ok=True)
-        
-        cert_file = cert_dir / "server.crt"
-        key_file = cert_dir / "server.key"
-        
-        if cert_file.exists() and key_file.exists():
-            self.logger.info("SSL certificates already exist")
-            return
-        
-        # Generate self-signed certificate
-        openssl_cmd = [
-            "openssl", "req", "-x509", "-newkey", "rsa:4096",
-            "-keyout", str(key_file),
-            "-out", str(cert_file),
-            "-days", "365", "-nodes",
-            "-subj", "/C=US/ST=CA/L=SF/O=ArtifactVirtual/CN=localhost"
-        ]
-        
-        try:
-            subprocess.run(openssl_cmd, check=True, capture_output=True)
-            self.logger.info(f"Generated SSL certificates: {cert_dir}")
-        except subprocess.CalledProcessError as e:
-            self.logger.warning(f"Failed to generate SSL certificates: {e}")
-            self.logger.info("Continuing without SSL...")
-
-    def create_landing_page(self):
-        """Create a simple landing page"""
-        html_dir = self.www_dir / "html"
-        html_dir.mkdir(exist_ok=True)
-        
-        index_html = html_dir / "index.html"
-        if index_html.exists():
-            return
-            
-        html_content = """<!DOCTYPE html>
+# Default landing page, encoded once at import
+INDEX_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -277,10 +214,217 @@ http {{
         setTimeout(() => location.reload(), 30000);
     </script>
 </body>
-</html>"""
+</html>""".encode()
+
+
+class PortableServer:
+    def __init__(self):
+        self.base_dir = Path(__file__).parent.absolute()
+        self.config_dir = self.base_dir / "config"
+        self.nginx_dir = self.base_dir / "nginx"
+        self.www_dir = self.base_dir / "www"
+        self.ssl_dir = self.base_dir / "ssl"
+        self.logs_dir = self.base_dir / "logs"
+        self.monitor_dir = self.base_dir / "monitor"
+        
+        self.pid_file = self.logs_dir / "nginx.pid"
         
-        index_html.write_text(html_content)
-        self.logger.info(f"Created landing page: {index_html}")
+        # Directories the server writes into, created once the dependency check passes
+        self._required_dirs = (
+            self.logs_dir,
+            self.ssl_dir / "certs",
+            self.www_dir / "html",
+            self.config_dir,
+        )
+        
+        # Platform never changes at runtime, so resolve it once
+        self._is_windows = platform.system() == "Windows"
+        self._nginx_binary = str(self.nginx_dir / ("nginx.exe" if self._is_windows else "nginx"))
+        
+        # Every template value is fixed by now, so render nginx.conf once
+        self._nginx_conf_bytes = NGINX_TEMPLATE.format_map(self.nginx_config_values()).strip().encode()
+        
+        self.nginx_process = None
+        self.nginx_pid = None
+        self._monitor_task = None
+        self.is_running = False
+        self._loop = None
+        self._shutdown = None
+        
+        # Setup logging
+        self.setup_logging()
+    
+    def _ensure_dirs(self):
+        """Create every writable directory in one pass"""
+        for path in self._required_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+        
+    def setup_logging(self):
+        """Setup logging configuration"""
+        self.logs_dir.mkdir(exist_ok=True)
+        
+        # Reopens server.log if logrotate moves it away
+        file_handler = WatchedFileHandler(self.logs_dir / 'server.log')
+        stream_handler = logging.StreamHandler()
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        
+        # Callers only enqueue records; a background thread does the writes
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        self._log_listener = QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        self.logger = logging.getLogger(__name__)
+
+    def check_dependencies(self) -> bool:
+        """Check if all required files and directories exist"""
+        required_dirs = [
+            self.config_dir,
+            self.nginx_dir,
+            self.www_dir,
+            self.ssl_dir,
+            self.logs_dir
+        ]
+        
+        missing_dirs = []
+        for dir_path in required_dirs:
+            if not dir_path.exists():
+                missing_dirs.append(str(dir_path))
+        
+        if missing_dirs:
+            self.logger.error(f"Missing directories: {missing_dirs}")
+            self.logger.info("Run './setup.py' first to initialize the server")
+            return False
+        
+        # Check for nginx binary
+        nginx_binary = self.get_nginx_binary()
+        if not nginx_binary or not Path(nginx_binary).exists():
+            self.logger.error("Nginx binary not found")
+            return False
+            
+        return True
+
+    def get_nginx_binary(self) -> Optional[str]:
+        """Get the appropriate nginx binary for the current platform"""
+        return self._nginx_binary
+
+    def generate_nginx_config(self):
+        """Generate nginx configuration"""
+        config_file = self.config_dir / "nginx.conf"
+        
+        existing = config_file.read_bytes() if config_file.exists() else b""
+        if existing == self._nginx_conf_bytes:
+            self.logger.info(f"Nginx config unchanged: {config_file}")
+            return
+        
+        config_file.write_bytes(self._nginx_conf_bytes)
+        self.logger.info(f"Generated nginx config: {config_file}")
+
+    def nginx_config_values(self) -> dict:
+        """Values substituted into NGINX_TEMPLATE"""
+        linux_only = lambda directive: "" if self._is_windows else directive
+        return {
+            "logs_dir": self.logs_dir,
+            "www_dir": self.www_dir,
+            "ssl_dir": self.ssl_dir,
+            "pid_file": self.pid_file,
+            "event_method": "select" if self._is_windows else "epoll",
+            "thread_pool": linux_only("thread_pool default threads=32 max_queue=65536;"),
+            "cpu_affinity": linux_only("worker_cpu_affinity auto;"),
+            "multi_accept": linux_only("multi_accept on;"),
+            "accept_mutex": linux_only("accept_mutex off;"),
+            "aio": linux_only("aio threads=default;"),
+            "reuseport": linux_only(" reuseport"),
+        }
+
+    def generate_ssl_certificates(self):
+        """Generate self-signed SSL certificates"""
+        cert_dir = self.ssl_dir / "certs"
+        
+        cert_file = cert_dir / "server.crt"
+        key_file = cert_dir / "server.key"
+        
+        if cert_file.exists() and key_file.exists():
+            self.logger.info("SSL certificates already exist")
+            return
+        
+        if x509 is not None:
+            try:
+                self.write_self_signed_certificate(cert_file, key_file)
+                self.logger.info(f"Generated SSL certificates: {cert_dir}")
+                return
+            except Exception as e:
+                self.logger.warning(f"In-process certificate generation failed: {e}")
+        
+        # Generate self-signed certificate
+        openssl_cmd = [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048",
+            "-keyout", str(key_file),
+            "-out", str(cert_file),
+            "-days", "365", "-nodes",
+            "-subj", "/C=US/ST=CA/L=SF/O=ArtifactVirtual/CN=localhost"
+        ]
+        
+        try:
+            subprocess.run(openssl_cmd, check=True, capture_output=True)
+            self.logger.info(f"Generated SSL certificates: {cert_dir}")
+        except subprocess.CalledProcessError as e:
+            self.logger.warning(f"Failed to generate SSL certificates: {e}")
+            self.logger.info("Continuing without SSL...")
+
+    def write_self_signed_certificate(self, cert_file: Path, key_file: Path):
+        """Generate the self-signed certificate in-process with cryptography"""
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([
+            x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+            x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "CA"),
+            x509.NameAttribute(NameOID.LOCALITY_NAME, "SF"),
+            x509.NameAttribute(NameOID.ORGANIZATION_NAME, "ArtifactVirtual"),
+            x509.NameAttribute(NameOID.COMMON_NAME, "localhost"),
+        ])
+        now = datetime.now(timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=365))
+            .sign(key, hashes.SHA256())
+        )
+        
+        key_bytes = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption()
+        )
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key_bytes)
+        cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+    def create_landing_page(self):
+        """Create a simple landing page"""
+        html_dir = self.www_dir / "html"
+        
+        index_html = html_dir / "index.html"
+        # Never overwrite a page the user has customised
+        if not index_html.exists():
+            index_html.write_bytes(INDEX_HTML)
+            self.logger.info(f"Created landing page: {index_html}")
+        
+        # gzip_static serves this copy, so refresh it whenever the page is newer
+        index_gz = html_dir / "index.html.gz"
+        if not index_gz.exists() or index_gz.stat().st_mtime < index_html.stat().st_mtime:
+            index_gz.write_bytes(gzip.compress(index_html.read_bytes(), 9))
 
     def start_nginx(self):
         """Start nginx server"""
@@ -289,40 +433,110 @@ http {{
         
         cmd = [nginx_binary, "-c", str(config_file)]
         
+        # Validate the generated config before touching any running instance
+        try:
+            subprocess.run(
+                [nginx_binary, "-t", "-c", str(config_file)],
+                check=True, capture_output=True, cwd=str(self.base_dir)
+            )
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Nginx config test failed: {e.stderr.decode(errors='replace').strip()}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Failed to test Nginx config: {e}")
+            return False
+        
+        # Hot-reload an already running master instead of starting a second one
+        if self.pid_file.exists():
+            result = subprocess.run(
+                [nginx_binary, "-s", "reload", "-c", str(config_file)],
+                capture_output=True, cwd=str(self.base_dir)
+            )
+            if result.returncode == 0:
+                self.nginx_pid = self.read_nginx_pid()
+                self.logger.info(f"Reloaded Nginx server (PID: {self.nginx_pid})")
+                return True
+            self.logger.warning("Stale nginx.pid, starting a fresh Nginx server")
+            self.pid_file.unlink(missing_ok=True)
+        
         try:
+            # No preexec_fn/session changes, so CPython can vfork/posix_spawn
+            # instead of copying this process's page tables with fork()
             self.nginx_process = subprocess.Popen(
                 cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
                 cwd=str(self.base_dir)
             )
-            self.logger.info(f"Started Nginx server (PID: {self.nginx_process.pid})")
+            self.nginx_pid = self.read_nginx_pid() or self.nginx_process.pid
+            self.logger.info(f"Started Nginx server (PID: {self.nginx_pid})")
             return True
         except Exception as e:
             self.logger.error(f"Failed to start Nginx: {e}")
             return False
 
-    def start_monitor(self):
-        """Start monitoring dashboard"""
+    def read_nginx_pid(self) -> Optional[int]:
+        """Read the master PID nginx wrote to its pidfile"""
+        # The master writes the pidfile shortly after startup
+        deadline = time.monotonic() + PID_FILE_TIMEOUT
+        while True:
+            try:
+                return int(self.pid_file.read_text().strip())
+            except (OSError, ValueError):
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.05)
+
+    async def start_monitor(self):
+        """Run the monitoring dashboard as a task on this event loop"""
         monitor_script = self.monitor_dir / "dashboard.py"
         if not monitor_script.exists():
             self.logger.warning("Monitoring dashboard not found")
             return False
-            
+        
         try:
-            self.monitor_process = subprocess.Popen([
-                sys.executable, str(monitor_script)
-            ], cwd=str(self.base_dir))
-            self.logger.info(f"Started monitoring dashboard (PID: {self.monitor_process.pid})")
+            spec = importlib.util.spec_from_file_location("dashboard", monitor_script)
+            dashboard_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(dashboard_module)
+            dashboard = dashboard_module.MonitoringDashboard()
+            if not hasattr(dashboard, "make_layout"):
+                self.logger.warning("Monitoring dashboard is outdated, re-run setup.py")
+                return False
+            
+            self._monitor_task = asyncio.create_task(self.run_monitor(dashboard))
+            self.logger.info("Started monitoring dashboard")
             return True
         except Exception as e:
             self.logger.error(f"Failed to start monitoring: {e}")
             return False
 
+    async def run_monitor(self, dashboard):
+        """Redraw the dashboard until cancelled"""
+        try:
+            from rich.live import Live
+            
+            # make_layout blocks for its one-second CPU sample; keep it off the loop
+            loop = asyncio.get_running_loop()
+            layout = await loop.run_in_executor(None, dashboard.make_layout)
+            with Live(layout, refresh_per_second=1) as live:
+                while True:
+                    live.update(await loop.run_in_executor(None, dashboard.make_layout))
+        except Exception as e:
+            self.logger.error(f"Monitoring dashboard stopped: {e}")
+
     def stop_all(self):
         """Stop all processes"""
         self.is_running = False
         
+        # The daemonized master (or a reloaded one) is not our child process
+        if self.nginx_pid and (not self.nginx_process or self.nginx_pid != self.nginx_process.pid):
+            try:
+                os.kill(self.nginx_pid, signal.SIGTERM)
+                self.logger.info("Stopped Nginx master")
+            except OSError:
+                pass
+        
         if self.nginx_process:
             try:
                 self.nginx_process.terminate()
@@ -330,64 +544,73 @@ http {{
                 self.logger.info("Stopped Nginx server")
             except:
                 self.nginx_process.kill()
-                
-        if self.monitor_process:
-            try:
-                self.monitor_process.terminate()
-                self.monitor_process.wait(timeout=5)
-                self.logger.info("Stopped monitoring dashboard")
-            except:
-                self.monitor_process.kill()
 
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         self.logger.info(f"Received signal {signum}, shutting down...")
-        self.stop_all()
-        sys.exit(0)
+        # May run outside the event loop (signal.signal on Windows)
+        self._loop.call_soon_threadsafe(self._shutdown.set)
+
+    def install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to the shutdown event"""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(signum, self.signal_handler, signum, None)
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler
+                signal.signal(signum, self.signal_handler)
 
     def start(self):
         """Start the complete server stack"""
         print("🚀 ArtifactVirtual.com - Portable Server")
         print("=" * 50)
         
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
-        
         # Check dependencies
         if not self.check_dependencies():
             print("❌ Dependencies check failed!")
             return False
+        self._ensure_dirs()
         
         # Generate configurations
         self.generate_nginx_config()
         self.generate_ssl_certificates()
         self.create_landing_page()
         
+        try:
+            return asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            return True
+
+    async def serve(self):
+        """Run nginx and the monitoring dashboard until a shutdown signal"""
+        self._loop = asyncio.get_running_loop()
+        self._shutdown = asyncio.Event()
+        self.install_signal_handlers()
+        
         # Start services
         print("🔧 Starting services...")
         
         if not self.start_nginx():
             print("❌ Failed to start Nginx")
             return False
-            
-        self.start_monitor()  # Optional, continue if fails
         
         self.is_running = True
         
-        print("✅ Server started successfully!")
-        print(f"🌐 Landing Page: http://localhost:8080")
-        print(f"🔒 SSL Version: https://localhost:8443")
-        print(f"📊 Health Check: http://localhost:8080/health")
-        print("\nPress Ctrl+C to stop the server")
-        
-        # Keep running
         try:
-            while self.is_running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            pass
+            await self.start_monitor()  # Optional, continue if fails
+            
+            print("✅ Server started successfully!")
+            print(f"🌐 Landing Page: http://localhost:8080")
+            print(f"🔒 SSL Version: https://localhost:8443")
+            print(f"📊 Health Check: http://localhost:8080/health")
+            print("\nPress Ctrl+C to stop the server")
+            
+            # Block until a signal handler requests shutdown
+            await self._shutdown.wait()
         finally:
+            if self._monitor_task:
+                self._monitor_task.cancel()
+                await asyncio.gather(self._monitor_task, return_exceptions=True)
             self.stop_all()
         
         return True
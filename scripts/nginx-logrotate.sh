@@ -0,0 +1,20 @@
+#!/bin/sh
+# Size-capped rotation for the bind-mounted nginx logs (runs inside the nginx container).
+# The bind mount replaces the image's stdout/stderr symlinks, so nothing else rotates them.
+
+MAX_BYTES=${NGINX_LOG_MAX_BYTES:-52428800}
+CHECK_INTERVAL=600
+
+while :; do
+    sleep "$CHECK_INTERVAL" & wait $!
+    rotated=""
+    for log in /var/log/nginx/*.log; do
+        [ -f "$log" ] || continue
+        if [ "$(stat -c %s "$log")" -gt "$MAX_BYTES" ]; then
+            # Keep one previous generation; readers follow the new inode after reopen
+            mv -f "$log" "$log.1"
+            rotated=1
+        fi
+    done
+    [ -n "$rotated" ] && nginx -s reopen
+done
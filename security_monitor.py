@@ -5,14 +5,20 @@ Advanced cybersecurity monitoring with beautiful CLI visualization
 """
 
 import asyncio
+import concurrent.futures
+import math
+import os
 import time
-import json
-import subprocess
+import re
+import ssl
+import sys
+import aiohttp
 import psutil
-import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from rich.console import Console
@@ -23,27 +29,175 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.gauge import Gauge
 from rich.text import Text
-from rich.align import Align
 from rich import box
 from rich.columns import Columns
 from rich.tree import Tree
 
+try:
+    import aiodocker
+except ImportError:
+    aiodocker = None
 
-@dataclass
+try:
+    from cryptography import x509
+except ImportError:
+    x509 = None
+
+# Label compose puts on every container it manages
+COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+
+# Compose project name: COMPOSE_PROJECT_NAME, else the normalised directory name
+COMPOSE_PROJECT = os.environ.get(
+    "COMPOSE_PROJECT_NAME",
+    re.sub(r"[^a-z0-9_-]", "", Path(__file__).parent.name.lower())
+)
+
+# Cell text per threshold outcome, indexed by the (bool) comparison result
+USAGE_LEVELS = ("🟢 OK", "🔴 HIGH")
+LOGIN_THREAT_LEVELS = ("🟢 LOW", "🔴 HIGH")
+ACTIVITY_THREAT_LEVELS = ("🟢 LOW", "🟡 MEDIUM")
+SSL_THREAT_LEVELS = ("🟢 OK", "🔴 CRITICAL")
+# Certificate cell when its expiry could not be read
+SSL_UNKNOWN_LEVEL = "🟡 UNKNOWN"
+
+# Service status cells; anything else renders as a yellow unknown state
+SERVICE_STATUS_LABELS = {"healthy": "🟢 HEALTHY", "unhealthy": "🔴 UNHEALTHY"}
+
+# response_times keys for the service table rows, in row order
+SERVICE_TIMING_KEYS = ("nginx", "landing_page", "backend_api", "certbot")
+
+# `docker ps` row: compose service and container state, tab separated
+DOCKER_PS_FORMAT = '{{.Label "com.docker.compose.service"}}\t{{.State}}'
+
+# nginx logs, bind-mounted from the nginx container (see docker-compose.yml)
+NGINX_LOG_DIR = Path(__file__).parent / "data" / "logs" / "nginx"
+ACCESS_LOG = NGINX_LOG_DIR / "access.log"
+ERROR_LOG = NGINX_LOG_DIR / "error.log"
+
+# Bytes read from a log per step, so a large backlog never sits in memory at once
+LOG_READ_CHUNK = 1 << 20
+
+# Client address and status of each 4xx line in the combined log format:
+# addr - user [time] "request" status bytes "referer" "agent"
+ACCESS_4XX_PATTERN = re.compile(rb'^(\S+) [^"\n]*"[^"\n]*" (4\d\d) ', re.MULTILINE)
+
+# Let's Encrypt certificate, bind-mounted from the certbot container
+SSL_CERT_FILE = Path(__file__).parent / "data" / "certbot" / "conf" / "live" / "artifactvirtual.com" / "cert.pem"
+
+# Fallback when the logs are not bind-mounted: one exec inside the nginx
+# container prints the rate-limit hit count, the 401 count, then "addr count"
+# for every client with 4xx responses
+CONTAINER_LOG_SCRIPT = (
+    "echo $(grep -c 'limiting requests' /var/log/nginx/error.log 2>/dev/null); "
+    "awk '$9 ~ /^4[0-9][0-9]$/ { n[$1]++; if ($9 == 401) f++ } "
+    "END { print f + 0; for (ip in n) print ip, n[ip] }' /var/log/nginx/access.log 2>/dev/null"
+)
+
+# nginx stub_status endpoint (see data/nginx/status.conf)
+NGINX_STATUS_URL = "http://127.0.0.1:8089/nginx_status"
+
+# __slots__ for the metric dataclasses where supported (dataclass slots= is 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Seconds between certificate expiry checks
+SSL_CHECK_INTERVAL = 3600
+
+# Seconds between refreshes of the other collectors and of the screen
+SYSTEM_INTERVAL = 1.0
+SERVICE_INTERVAL = 15.0
+SECURITY_INTERVAL = 30.0
+RENDER_INTERVAL = 1.0
+
+# Count-Min sketch size for per-address 4xx counts (depth x width counters,
+# 64 KiB) and how many of the heaviest addresses to keep by name
+IP_SKETCH_DEPTH = 4
+IP_SKETCH_WIDTH = 4096
+IP_SKETCH_TOP = 16
+
+# "Expiry Date: 2025-01-01 00:00:00+00:00 (VALID: 89 days)" in certbot output
+CERTBOT_EXPIRY_PATTERN = re.compile(r"Expiry Date: (\S+ \S+)")
+
+
+async def run_command(*cmd: str, timeout: float = 5) -> Tuple[int, str]:
+    """Run a command without blocking the event loop; returns (returncode, stdout)"""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return process.returncode, stdout.decode(errors="replace")
+
+
+class IPSketch:
+    """Approximate per-address counts and top offenders in fixed memory"""
+    
+    def __init__(self, depth: int = IP_SKETCH_DEPTH, width: int = IP_SKETCH_WIDTH, top: int = IP_SKETCH_TOP):
+        self.width = width
+        self.rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+        self.top_size = top
+        self.top: Dict[bytes, int] = {}
+    
+    def add(self, addr: bytes, count: int = 1):
+        """Count an address and keep it if it is now among the heaviest"""
+        # Double hashing: row i uses h1 + i * h2
+        h1 = hash(addr)
+        h2 = hash((addr,)) | 1
+        estimate = None
+        for i, row in enumerate(self.rows):
+            col = (h1 + i * h2) % self.width
+            row[col] += count
+            if estimate is None or row[col] < estimate:
+                estimate = row[col]
+        
+        if addr in self.top or len(self.top) < self.top_size:
+            self.top[addr] = estimate
+            return
+        lightest = min(self.top, key=self.top.get)
+        if estimate > self.top[lightest]:
+            del self.top[lightest]
+            self.top[addr] = estimate
+    
+    def most_common(self) -> Counter:
+        """Estimated counts of the heaviest addresses"""
+        return Counter(self.top)
+    
+    def distinct(self) -> int:
+        """Estimated number of distinct addresses (linear counting on the first row)"""
+        empty = self.rows[0].count(0)
+        if empty == 0:
+            return int(self.width * math.log(self.width))
+        return round(self.width * math.log(self.width / empty))
+
+
+class Timestamp:
+    """Current time, formatted when Rich draws it rather than on every refresh"""
+    
+    def __rich__(self) -> Text:
+        return Text(f"Last Updated: {datetime.now():%Y-%m-%d %H:%M:%S}", style="dim")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SecurityMetrics:
     failed_logins: int = 0
-    suspicious_ips: List[str] = None
+    # Estimated 4xx responses for the heaviest client addresses, and
+    # roughly how many distinct clients got a 4xx
+    suspicious_ip_counts: Counter = field(default_factory=Counter)
+    suspicious_ip_total: int = 0
     active_connections: int = 0
-    ssl_certificate_days: int = 0
+    # None until the certificate has been read successfully
+    ssl_certificate_days: Optional[int] = None
     rate_limit_hits: int = 0
     blocked_requests: int = 0
-    
-    def __post_init__(self):
-        if self.suspicious_ips is None:
-            self.suspicious_ips = []
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SystemMetrics:
     cpu_percent: float = 0.0
     memory_percent: float = 0.0
@@ -53,7 +207,7 @@ class SystemMetrics:
     load_average: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ServiceMetrics:
     nginx_status: str = "unknown"
     nginx_requests: int = 0
@@ -83,43 +237,170 @@ class SecurityMonitor:
             'response_time': 2.0
         }
         
+        # (predicate, message) pairs checked in order by create_alerts_panel
+        self._alert_rules = [
+            # System alerts
+            (lambda m: m.system_metrics.cpu_percent > m.alert_threshold['cpu'], "🔴 HIGH CPU USAGE DETECTED"),
+            (lambda m: m.system_metrics.memory_percent > m.alert_threshold['memory'], "🔴 HIGH MEMORY USAGE DETECTED"),
+            (lambda m: m.system_metrics.disk_percent > m.alert_threshold['disk'], "🔴 HIGH DISK USAGE DETECTED"),
+            # Security alerts
+            (lambda m: m.security_metrics.failed_logins > m.alert_threshold['failed_logins'], "🛡️ MULTIPLE FAILED LOGIN ATTEMPTS"),
+            (lambda m: m.security_metrics.suspicious_ip_total > 5, "🛡️ SUSPICIOUS IP ACTIVITY DETECTED"),
+            (lambda m: m.security_metrics.ssl_certificate_days is not None and m.security_metrics.ssl_certificate_days < 7, "🔒 SSL CERTIFICATE EXPIRING SOON"),
+        ]
+        
+        # Docker daemon access: the aiodocker client is created inside the
+        # event loop on first use, container ids are resolved once per service
+        self.docker = None
+        self._container_ids: Dict[str, str] = {}
+        
+        # Log scan state: (inode, offset) per file and running tallies
+        self._log_state: Dict[Path, Tuple[int, int]] = {}
+        self._failed_login_count = 0
+        self._rate_limit_count = 0
+        self._suspicious_ips = IPSketch()
+        
+        # (checked_at monotonic, certificate notAfter epoch)
+        self._ssl_cache: Tuple[Optional[float], Optional[float]] = (None, None)
+        
+        # Endpoint probes share one session, created inside the event loop
+        self.http: Optional[aiohttp.ClientSession] = None
+        
+        # psutil calls are blocking syscalls; run them off the event loop
+        self._exec = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
+        self.build_panels()
+        
+        # The first interval=None sample is meaningless; take it now
+        psutil.cpu_percent(interval=None)
+    
+    def get_docker(self):
+        """Shared aiodocker client, or None when aiodocker is not installed"""
+        if self.docker is None and aiodocker is not None:
+            self.docker = aiodocker.Docker()
+        return self.docker
+    
+    async def get_container_id(self, service: str) -> Optional[str]:
+        """Resolve a compose service's container id once and cache it"""
+        if service in self._container_ids:
+            return self._container_ids[service]
+        
+        label = f"{COMPOSE_SERVICE_LABEL}={service}"
+        docker = self.get_docker()
+        if docker is not None:
+            containers = await docker.containers.list(filters={"label": [label]})
+            ids = [container.id for container in containers]
+        else:
+            _, output = await run_command("docker", "ps", "-q", "--filter", f"label={label}")
+            ids = output.split()
+        
+        if not ids:
+            return None
+        self._container_ids[service] = ids[0]
+        return ids[0]
+    
+    async def docker_exec(self, service: str, *cmd: str, timeout: float = 5) -> str:
+        """Run a command in a compose service's container and return its stdout"""
+        container_id = await self.get_container_id(service)
+        if container_id is None:
+            return ""
+        
+        docker = self.get_docker()
+        try:
+            if docker is not None:
+                return await asyncio.wait_for(self.aiodocker_exec(container_id, list(cmd)), timeout)
+            returncode, output = await run_command("docker", "exec", container_id, *cmd, timeout=timeout)
+            # 125+ is docker itself failing, e.g. the container was recreated
+            if returncode >= 125:
+                self._container_ids.pop(service, None)
+            return output
+        except Exception:
+            self._container_ids.pop(service, None)
+            raise
+    
+    async def aiodocker_exec(self, container_id: str, cmd: List[str]) -> str:
+        """Exec through the Docker API and collect stdout"""
+        container = self.docker.containers.container(container_id)
+        execution = await container.exec(cmd, stdout=True, stderr=False)
+        output = []
+        async with execution.start(detach=False) as stream:
+            while True:
+                message = await stream.read_out()
+                if message is None:
+                    break
+                output.append(message.data)
+        return b"".join(output).decode(errors="replace")
+    
+    def get_http(self) -> aiohttp.ClientSession:
+        """Shared HTTP session; keeps TLS connections alive between probes"""
+        if self.http is None:
+            # One unverified context for every probe, so TLS sessions are resumed too
+            ssl_ctx = ssl.create_default_context()
+            ssl_ctx.check_hostname = False
+            ssl_ctx.verify_mode = ssl.CERT_NONE
+            self.http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=ssl_ctx, limit_per_host=4, keepalive_timeout=120)
+            )
+        return self.http
+    
+    async def close(self):
+        """Close the Docker API client and HTTP session"""
+        if self.docker is not None:
+            await self.docker.close()
+            self.docker = None
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+        self._exec.shutdown(wait=False)
+    
+    @staticmethod
+    def _sample_system() -> SystemMetrics:
+        """Take one psutil sample (runs in the executor thread)"""
+        net_io = psutil.net_io_counters()
+        return SystemMetrics(
+            # Non-blocking: usage since the previous call (primed in __init__)
+            cpu_percent=psutil.cpu_percent(interval=None),
+            memory_percent=psutil.virtual_memory().percent,
+            disk_percent=psutil.disk_usage('/').percent,
+            network_in=net_io.bytes_recv,
+            network_out=net_io.bytes_sent,
+            load_average=psutil.getloadavg(),
+        )
+        
     async def collect_system_metrics(self):
         """Collect system performance metrics"""
         try:
-            self.system_metrics.cpu_percent = psutil.cpu_percent(interval=1)
-            self.system_metrics.memory_percent = psutil.virtual_memory().percent
-            self.system_metrics.disk_percent = psutil.disk_usage('/').percent
-            
-            net_io = psutil.net_io_counters()
-            self.system_metrics.network_in = net_io.bytes_recv
-            self.system_metrics.network_out = net_io.bytes_sent
-            
-            self.system_metrics.load_average = psutil.getloadavg()
+            loop = asyncio.get_running_loop()
+            self.system_metrics = await loop.run_in_executor(self._exec, self._sample_system)
         except Exception as e:
             self.console.print(f"[red]Error collecting system metrics: {e}[/red]")
     
     async def collect_security_metrics(self):
         """Collect security-related metrics"""
         try:
-            # Check for failed login attempts (example from auth.log)
-            failed_logins = await self.get_failed_logins()
-            self.security_metrics.failed_logins = failed_logins
+            # One pass over the nginx logs feeds all log-based metrics. Mounted
+            # logs are read and scanned on the worker thread so a large backlog
+            # never stalls the render loop
+            if ACCESS_LOG.exists():
+                await asyncio.get_running_loop().run_in_executor(self._exec, self.scan_logs)
+            else:
+                await self.scan_container_logs()
             
-            # Get suspicious IPs from nginx logs
-            suspicious_ips = await self.get_suspicious_ips()
-            self.security_metrics.suspicious_ips = suspicious_ips
-            
-            # Check SSL certificate expiration
-            ssl_days = await self.get_ssl_certificate_days()
-            self.security_metrics.ssl_certificate_days = ssl_days
-            
-            # Check rate limiting
-            rate_limits = await self.get_rate_limit_hits()
-            self.security_metrics.rate_limit_hits = rate_limits
+            self.security_metrics.failed_logins = self._failed_login_count
+            self.security_metrics.suspicious_ip_counts = self._suspicious_ips.most_common()
+            self.security_metrics.suspicious_ip_total = self._suspicious_ips.distinct()
+            self.security_metrics.rate_limit_hits = self._rate_limit_count
             
         except Exception as e:
             self.console.print(f"[red]Error collecting security metrics: {e}[/red]")
     
+    async def collect_ssl_metrics(self):
+        """Collect SSL certificate expiration"""
+        try:
+            self.security_metrics.ssl_certificate_days = await self.get_ssl_certificate_days()
+        except Exception as e:
+            self.console.print(f"[red]Error collecting SSL metrics: {e}[/red]")
+    
     async def collect_service_metrics(self):
         """Collect service status and performance metrics"""
         try:
@@ -134,75 +415,132 @@ class SecurityMonitor:
             response_times = await self.check_response_times()
             self.service_metrics.response_times = response_times
             
+            # Connection and request counters straight from nginx
+            nginx_status = await self.get_nginx_status()
+            if nginx_status is not None:
+                self.security_metrics.active_connections, self.service_metrics.nginx_requests = nginx_status
+            
         except Exception as e:
             self.console.print(f"[red]Error collecting service metrics: {e}[/red]")
     
-    async def get_failed_logins(self) -> int:
-        """Get failed login attempts from logs"""
+    def read_appended(self, path: Path) -> Iterator[bytes]:
+        """Complete lines appended to a log since the last read, in bounded chunks, following rotation"""
         try:
-            result = subprocess.run(
-                ["docker-compose", "exec", "-T", "nginx", "grep", "-c", "401", "/var/log/nginx/access.log"],
-                capture_output=True, text=True, timeout=5
-            )
-            return int(result.stdout.strip()) if result.stdout.strip().isdigit() else 0
-        except:
-            return 0
+            f = open(path, "rb")
+        except OSError:
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            inode, offset = self._log_state.get(path, (stat.st_ino, 0))
+            # Rotated (new inode) or truncated: start over from the top
+            if inode != stat.st_ino or stat.st_size < offset:
+                offset = 0
+            f.seek(offset)
+            
+            partial = b""
+            while True:
+                chunk = f.read(LOG_READ_CHUNK)
+                if not chunk:
+                    break
+                chunk = partial + chunk
+                # Carry the unfinished last line over into the next chunk
+                end = chunk.rfind(b"\n") + 1
+                partial = chunk[end:]
+                if end:
+                    offset += end
+                    self._log_state[path] = (stat.st_ino, offset)
+                    yield chunk[:end]
+            # A partially written last line is left for the next read
+            self._log_state[path] = (stat.st_ino, offset)
     
-    async def get_suspicious_ips(self) -> List[str]:
-        """Get suspicious IP addresses from nginx logs"""
-        try:
-            result = subprocess.run([
-                "docker-compose", "exec", "-T", "nginx", "awk",
-                "($9 ~ /4[0-9][0-9]/) { print $1 }", "/var/log/nginx/access.log"
-            ], capture_output=True, text=True, timeout=5)
-            ips = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            return list(set(ips))[:10]  # Return top 10 unique IPs
-        except:
-            return []
+    def scan_logs(self):
+        """Tally 4xx responses and rate-limit hits from newly appended log lines"""
+        for chunk in self.read_appended(ERROR_LOG):
+            self._rate_limit_count += chunk.count(b"limiting requests")
+        
+        for chunk in self.read_appended(ACCESS_LOG):
+            # One regex pass over the whole chunk rather than a Python loop per line
+            hits = ACCESS_4XX_PATTERN.findall(chunk)
+            self._failed_login_count += sum(1 for _, status in hits if status == b"401")
+            # Aggregate the chunk first so the sketch sees each address once
+            for addr, count in Counter(addr for addr, _ in hits).items():
+                self._suspicious_ips.add(addr, count)
     
-    async def get_ssl_certificate_days(self) -> int:
-        """Get SSL certificate expiration days"""
+    async def scan_container_logs(self):
+        """Recount all log tallies inside the nginx container with a single exec"""
         try:
-            result = subprocess.run([
-                "docker-compose", "exec", "-T", "certbot",
-                "certbot", "certificates", "--cert-name", "artifactvirtual.com"
-            ], capture_output=True, text=True, timeout=10)
-            
-            # Parse certificate expiration (simplified)
-            if "VALID:" in result.stdout:
-                return 30  # Placeholder - would parse actual date
-            return 0
+            output = await self.docker_exec("nginx", "sh", "-c", CONTAINER_LOG_SCRIPT)
         except:
-            return 0
+            return
+        
+        lines = output.splitlines() + ["", ""]
+        self._rate_limit_count = int(lines[0]) if lines[0].strip().isdigit() else 0
+        self._failed_login_count = int(lines[1]) if lines[1].strip().isdigit() else 0
+        
+        sketch = IPSketch()
+        for line in lines[2:]:
+            addr, _, count = line.rpartition(" ")
+            if count.isdigit():
+                sketch.add(addr.encode(), int(count))
+        self._suspicious_ips = sketch
     
-    async def get_rate_limit_hits(self) -> int:
-        """Get rate limiting hits"""
-        try:
-            result = subprocess.run([
-                "docker-compose", "exec", "-T", "nginx",
-                "grep", "-c", "limiting requests", "/var/log/nginx/error.log"
-            ], capture_output=True, text=True, timeout=5)
-            return int(result.stdout.strip()) if result.stdout.strip().isdigit() else 0
-        except:
-            return 0
+    async def get_ssl_certificate_days(self) -> Optional[int]:
+        """Get SSL certificate expiration days, or None when the certificate can't be read"""
+        # The expiry only changes on renewal, so re-read it at most hourly
+        checked_at, not_after = self._ssl_cache
+        if checked_at is None or time.monotonic() - checked_at >= SSL_CHECK_INTERVAL:
+            try:
+                not_after = await self.read_ssl_expiry()
+            except:
+                not_after = None
+            self._ssl_cache = (time.monotonic(), not_after)
+        
+        if not_after is None:
+            return None
+        return max(0, int((not_after - time.time()) // 86400))
+    
+    async def read_ssl_expiry(self) -> Optional[float]:
+        """Certificate notAfter as a Unix timestamp"""
+        # Read the bind-mounted certificate directly when possible
+        if x509 is not None and SSL_CERT_FILE.exists():
+            cert = x509.load_pem_x509_certificate(SSL_CERT_FILE.read_bytes())
+            not_after = getattr(cert, "not_valid_after_utc", None)
+            if not_after is None:
+                not_after = cert.not_valid_after.replace(tzinfo=timezone.utc)
+            return not_after.timestamp()
+        
+        output = await self.docker_exec(
+            "certbot", "certbot", "certificates", "--cert-name", "artifactvirtual.com", timeout=10
+        )
+        match = CERTBOT_EXPIRY_PATTERN.search(output)
+        if not match:
+            return None
+        return datetime.fromisoformat(match.group(1)).timestamp()
     
     async def get_docker_status(self) -> Dict[str, str]:
         """Get Docker container status"""
         try:
-            result = subprocess.run([
-                "docker-compose", "ps", "--format", "json"
-            ], capture_output=True, text=True, timeout=10)
+            project_label = f"{COMPOSE_PROJECT_LABEL}={COMPOSE_PROJECT}"
+            docker = self.get_docker()
+            if docker is not None:
+                containers = {}
+                for container in await docker.containers.list(all=True, filters={"label": [project_label]}):
+                    service = container["Labels"].get(COMPOSE_SERVICE_LABEL, '')
+                    containers[service] = 'healthy' if container["State"] == 'running' else 'unhealthy'
+                return containers
+            
+            # The daemon answers directly; no docker-compose interpreter, no JSON
+            _, output = await run_command(
+                "docker", "ps", "-a", "--filter", f"label={project_label}",
+                "--format", DOCKER_PS_FORMAT,
+                timeout=10
+            )
             
             containers = {}
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    try:
-                        data = json.loads(line)
-                        service = data.get('Service', '')
-                        state = data.get('State', 'unknown')
-                        containers[service] = 'healthy' if state == 'running' else 'unhealthy'
-                    except json.JSONDecodeError:
-                        continue
+            for line in output.splitlines():
+                service, _, state = line.partition('\t')
+                if service:
+                    containers[service] = 'healthy' if state == 'running' else 'unhealthy'
             return containers
         except:
             return {}
@@ -215,196 +553,252 @@ class SecurityMonitor:
             'api': 'https://artifactvirtual.com/api/health'
         }
         
-        response_times = {}
-        for name, url in endpoints.items():
-            try:
-                start_time = time.time()
-                response = requests.get(url, timeout=5, verify=False)
-                response_time = time.time() - start_time
-                response_times[name] = response_time
-            except:
-                response_times[name] = 999.0  # Timeout/error
+        results = await asyncio.gather(*(self.probe(name, url) for name, url in endpoints.items()))
+        return dict(results)
+    
+    async def probe(self, name: str, url: str) -> Tuple[str, float]:
+        """Time one HEAD (GET if HEAD is refused) on the shared keep-alive session"""
+        try:
+            timeout = aiohttp.ClientTimeout(total=5)
+            start_time = time.perf_counter()
+            async with self.get_http().head(url, timeout=timeout) as response:
+                status = response.status
+            if status == 405:
+                start_time = time.perf_counter()
+                async with self.get_http().get(url, timeout=timeout) as response:
+                    await response.read()
+            return name, time.perf_counter() - start_time
+        except Exception:
+            return name, 999.0  # Timeout/error
+    
+    async def get_nginx_status(self) -> Optional[Tuple[int, int]]:
+        """(active connections, total requests) from nginx stub_status"""
+        try:
+            async with self.get_http().get(NGINX_STATUS_URL, timeout=aiohttp.ClientTimeout(total=2)) as response:
+                text = await response.text()
+            # Active connections: N / server accepts handled requests / A H R / Reading ...
+            fields = text.split()
+            return int(fields[2]), int(fields[9])
+        except Exception:
+            return None
+    
+    def build_panels(self):
+        """Build the dashboard tree once; refreshes only rewrite cell values"""
+        self._system_table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
+        self._system_table.add_column("Metric", style="cyan", width=12)
+        self._system_table.add_column("Value", style="green", width=15)
+        self._system_table.add_column("Status", style="yellow", width=10)
+        self._system_cells = self.add_rows(
+            self._system_table, ("CPU Usage", "Memory", "Disk Usage", "Load Avg", "Network I/O")
+        )
+        self._system_panel = Panel(self._system_table, title="🖥️  System Metrics", border_style="blue")
+        
+        self._security_table = Table(show_header=True, header_style="bold red", box=box.ROUNDED)
+        self._security_table.add_column("Security Metric", style="cyan", width=18)
+        self._security_table.add_column("Value", style="white", width=15)
+        self._security_table.add_column("Threat Level", style="yellow", width=12)
+        self._security_cells = self.add_rows(
+            self._security_table, ("Failed Logins", "Suspicious IPs", "SSL Cert Days", "Rate Limit Hits", "Active Connections")
+        )
+        self._security_panel = Panel(self._security_table, title="🛡️  Security Metrics", border_style="red")
+        
+        self._service_table = Table(show_header=True, header_style="bold green", box=box.ROUNDED)
+        self._service_table.add_column("Service", style="cyan", width=15)
+        self._service_table.add_column("Status", style="white", width=12)
+        self._service_table.add_column("Response Time", style="yellow", width=15)
+        self._service_cells = self.add_rows(
+            self._service_table, ("Nginx", "Landing Page", "Backend API", "Certbot")
+        )
+        self._service_panel = Panel(self._service_table, title="🚀 Service Status", border_style="green")
         
-        return response_times
+        self._alerts_panel = Panel("", title="🚨 Active Alerts", border_style="red")
+        
+        header = Table.grid(expand=True)
+        header.add_column(justify="center", ratio=1)
+        header.add_column(justify="right")
+        header.add_row(
+            Text("🛡️ ArtifactVirtual Security Monitor Dashboard 🛡️", style="bold white on blue"),
+            Timestamp()
+        )
+        self._header = Panel(header, border_style="blue")
+        
+        layout = Layout()
+        
+        # Create main sections
+        layout.split_column(
+            Layout(self._header, name="header", size=3),
+            Layout(name="main", ratio=1)
+        )
+        
+        # Split main area
+        layout["main"].split_row(
+            Layout(name="left"),
+            Layout(name="right")
+        )
+        
+        # Split left column
+        layout["left"].split_column(
+            Layout(self._system_panel),
+            Layout(self._security_panel)
+        )
+        
+        # Split right column  
+        layout["right"].split_column(
+            Layout(self._service_panel),
+            Layout(self._alerts_panel)
+        )
+        
+        self._layout = layout
+    
+    @staticmethod
+    def add_rows(table: Table, labels: Tuple[str, ...]) -> List[Tuple[Text, Text]]:
+        """Add one row per label with empty value cells that refreshes rewrite in place"""
+        cells = []
+        for label in labels:
+            row = (Text(), Text())
+            table.add_row(label, *row)
+            cells.append(row)
+        return cells
+    
+    @staticmethod
+    def set_row(cells: List[Tuple[Text, Text]], row: int, *values: str):
+        """Overwrite the value cells of a prebuilt table row"""
+        for cell, value in zip(cells[row], values):
+            cell.plain = value
     
     def create_system_panel(self) -> Panel:
         """Create system metrics panel"""
-        table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
-        table.add_column("Metric", style="cyan", width=12)
-        table.add_column("Value", style="green", width=15)
-        table.add_column("Status", style="yellow", width=10)
+        cells = self._system_cells
         
         # CPU
-        cpu_status = "🔴 HIGH" if self.system_metrics.cpu_percent > self.alert_threshold['cpu'] else "🟢 OK"
-        table.add_row("CPU Usage", f"{self.system_metrics.cpu_percent:.1f}%", cpu_status)
+        cpu_status = USAGE_LEVELS[self.system_metrics.cpu_percent > self.alert_threshold['cpu']]
+        self.set_row(cells, 0, f"{self.system_metrics.cpu_percent:.1f}%", cpu_status)
         
         # Memory
-        mem_status = "🔴 HIGH" if self.system_metrics.memory_percent > self.alert_threshold['memory'] else "🟢 OK"
-        table.add_row("Memory", f"{self.system_metrics.memory_percent:.1f}%", mem_status)
+        mem_status = USAGE_LEVELS[self.system_metrics.memory_percent > self.alert_threshold['memory']]
+        self.set_row(cells, 1, f"{self.system_metrics.memory_percent:.1f}%", mem_status)
         
         # Disk
-        disk_status = "🔴 HIGH" if self.system_metrics.disk_percent > self.alert_threshold['disk'] else "🟢 OK"
-        table.add_row("Disk Usage", f"{self.system_metrics.disk_percent:.1f}%", disk_status)
+        disk_status = USAGE_LEVELS[self.system_metrics.disk_percent > self.alert_threshold['disk']]
+        self.set_row(cells, 2, f"{self.system_metrics.disk_percent:.1f}%", disk_status)
         
         # Load Average
         load_1, load_5, load_15 = self.system_metrics.load_average
-        table.add_row("Load Avg", f"{load_1:.2f}, {load_5:.2f}, {load_15:.2f}", "🟢 OK")
+        self.set_row(cells, 3, f"{load_1:.2f}, {load_5:.2f}, {load_15:.2f}", "🟢 OK")
         
         # Network
         net_in_mb = self.system_metrics.network_in / (1024 * 1024)
         net_out_mb = self.system_metrics.network_out / (1024 * 1024)
-        table.add_row("Network I/O", f"↓{net_in_mb:.1f}MB ↑{net_out_mb:.1f}MB", "🟢 OK")
+        self.set_row(cells, 4, f"↓{net_in_mb:.1f}MB ↑{net_out_mb:.1f}MB", "🟢 OK")
         
-        return Panel(table, title="🖥️  System Metrics", border_style="blue")
+        return self._system_panel
     
     def create_security_panel(self) -> Panel:
         """Create security metrics panel"""
-        table = Table(show_header=True, header_style="bold red", box=box.ROUNDED)
-        table.add_column("Security Metric", style="cyan", width=18)
-        table.add_column("Value", style="white", width=15)
-        table.add_column("Threat Level", style="yellow", width=12)
+        cells = self._security_cells
         
         # Failed logins
-        login_threat = "🔴 HIGH" if self.security_metrics.failed_logins > self.alert_threshold['failed_logins'] else "🟢 LOW"
-        table.add_row("Failed Logins", str(self.security_metrics.failed_logins), login_threat)
+        login_threat = LOGIN_THREAT_LEVELS[self.security_metrics.failed_logins > self.alert_threshold['failed_logins']]
+        self.set_row(cells, 0, str(self.security_metrics.failed_logins), login_threat)
         
         # Suspicious IPs
-        ip_count = len(self.security_metrics.suspicious_ips)
-        ip_threat = "🟡 MEDIUM" if ip_count > 5 else "🟢 LOW"
-        table.add_row("Suspicious IPs", str(ip_count), ip_threat)
+        ip_count = self.security_metrics.suspicious_ip_total
+        ip_threat = ACTIVITY_THREAT_LEVELS[ip_count > 5]
+        self.set_row(cells, 1, str(ip_count), ip_threat)
         
         # SSL Certificate
-        ssl_threat = "🔴 CRITICAL" if self.security_metrics.ssl_certificate_days < 7 else "🟢 OK"
-        table.add_row("SSL Cert Days", str(self.security_metrics.ssl_certificate_days), ssl_threat)
+        ssl_days = self.security_metrics.ssl_certificate_days
+        if ssl_days is None:
+            self.set_row(cells, 2, "unknown", SSL_UNKNOWN_LEVEL)
+        else:
+            self.set_row(cells, 2, str(ssl_days), SSL_THREAT_LEVELS[ssl_days < 7])
         
         # Rate Limiting
-        rate_threat = "🟡 MEDIUM" if self.security_metrics.rate_limit_hits > 100 else "🟢 LOW"
-        table.add_row("Rate Limit Hits", str(self.security_metrics.rate_limit_hits), rate_threat)
+        rate_threat = ACTIVITY_THREAT_LEVELS[self.security_metrics.rate_limit_hits > 100]
+        self.set_row(cells, 3, str(self.security_metrics.rate_limit_hits), rate_threat)
         
         # Active Connections
-        table.add_row("Active Connections", str(self.security_metrics.active_connections), "🟢 NORMAL")
+        self.set_row(cells, 4, str(self.security_metrics.active_connections), "🟢 NORMAL")
         
-        return Panel(table, title="🛡️  Security Metrics", border_style="red")
+        return self._security_panel
     
     def create_service_panel(self) -> Panel:
         """Create service status panel"""
-        table = Table(show_header=True, header_style="bold green", box=box.ROUNDED)
-        table.add_column("Service", style="cyan", width=15)
-        table.add_column("Status", style="white", width=12)
-        table.add_column("Response Time", style="yellow", width=15)
-        
-        services = {
-            "Nginx": self.service_metrics.nginx_status,
-            "Landing Page": self.service_metrics.landing_page_status,
-            "Backend API": self.service_metrics.backend_api_status,
-            "Certbot": self.service_metrics.certbot_status
-        }
+        statuses = (
+            self.service_metrics.nginx_status,
+            self.service_metrics.landing_page_status,
+            self.service_metrics.backend_api_status,
+            self.service_metrics.certbot_status
+        )
         
-        for service, status in services.items():
-            status_icon = "🟢" if status == "healthy" else "🔴" if status == "unhealthy" else "🟡"
-            response_time = self.service_metrics.response_times.get(service.lower().replace(' ', '_'), 0)
+        response_times = self.service_metrics.response_times
+        for row, (status, key) in enumerate(zip(statuses, SERVICE_TIMING_KEYS)):
+            status_label = SERVICE_STATUS_LABELS.get(status) or f"🟡 {status.upper()}"
+            response_time = response_times.get(key, 0)
             rt_display = f"{response_time*1000:.0f}ms" if response_time < 10 else "TIMEOUT"
-            table.add_row(service, f"{status_icon} {status.upper()}", rt_display)
+            self.set_row(self._service_cells, row, status_label, rt_display)
         
-        return Panel(table, title="🚀 Service Status", border_style="green")
+        return self._service_panel
     
     def create_alerts_panel(self) -> Panel:
         """Create alerts and notifications panel"""
-        alerts = []
-        
-        # System alerts
-        if self.system_metrics.cpu_percent > self.alert_threshold['cpu']:
-            alerts.append("🔴 HIGH CPU USAGE DETECTED")
-        if self.system_metrics.memory_percent > self.alert_threshold['memory']:
-            alerts.append("🔴 HIGH MEMORY USAGE DETECTED")
-        if self.system_metrics.disk_percent > self.alert_threshold['disk']:
-            alerts.append("🔴 HIGH DISK USAGE DETECTED")
-        
-        # Security alerts
-        if self.security_metrics.failed_logins > self.alert_threshold['failed_logins']:
-            alerts.append("🛡️ MULTIPLE FAILED LOGIN ATTEMPTS")
-        if len(self.security_metrics.suspicious_ips) > 5:
-            alerts.append("🛡️ SUSPICIOUS IP ACTIVITY DETECTED")
-        if self.security_metrics.ssl_certificate_days < 7:
-            alerts.append("🔒 SSL CERTIFICATE EXPIRING SOON")
+        alerts = [message for triggered, message in self._alert_rules if triggered(self)]
         
         # Service alerts
+        slow = self.alert_threshold['response_time']
         for service, rt in self.service_metrics.response_times.items():
-            if rt > self.alert_threshold['response_time']:
+            if rt > slow:
                 alerts.append(f"⚡ HIGH RESPONSE TIME: {service.upper()}")
         
         if not alerts:
             alerts.append("🟢 ALL SYSTEMS OPERATIONAL")
         
-        alert_text = "\n".join(alerts)
-        return Panel(alert_text, title="🚨 Active Alerts", border_style="red")
+        self._alerts_panel.renderable = "\n".join(alerts)
+        return self._alerts_panel
     
     def create_dashboard_layout(self) -> Layout:
-        """Create the main dashboard layout"""
-        layout = Layout()
-        
-        # Header
-        header = Panel(
-            Align.center(
-                Text("🛡️ ArtifactVirtual Security Monitor Dashboard 🛡️", style="bold white on blue"),
-                vertical="middle"
-            ),
-            title=f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            border_style="blue"
-        )
-        
-        # Create main sections
-        layout.split_column(
-            Layout(header, size=3),
-            Layout(name="main", ratio=1)
-        )
-        
-        # Split main area
-        layout["main"].split_row(
-            Layout(name="left"),
-            Layout(name="right")
-        )
-        
-        # Split left column
-        layout["left"].split_column(
-            Layout(self.create_system_panel()),
-            Layout(self.create_security_panel())
-        )
-        
-        # Split right column  
-        layout["right"].split_column(
-            Layout(self.create_service_panel()),
-            Layout(self.create_alerts_panel())
-        )
-        
-        return layout
+        """Refresh the prebuilt dashboard layout in place"""
+        self.create_system_panel()
+        self.create_security_panel()
+        self.create_service_panel()
+        self.create_alerts_panel()
+        return self._layout
     
     async def run_dashboard(self):
         """Run the monitoring dashboard"""
         self.console.print("[bold green]🚀 Starting ArtifactVirtual Security Monitor...[/bold green]")
         
-        with Live(self.create_dashboard_layout(), refresh_per_second=1, screen=True) as live:
-            while True:
-                try:
-                    # Collect all metrics
-                    await asyncio.gather(
-                        self.collect_system_metrics(),
-                        self.collect_security_metrics(),
-                        self.collect_service_metrics()
-                    )
-                    
-                    # Update dashboard
-                    live.update(self.create_dashboard_layout())
-                    
-                    # Wait before next update
-                    await asyncio.sleep(5)
-                    
-                except KeyboardInterrupt:
-                    self.console.print("[yellow]Dashboard stopped by user[/yellow]")
-                    break
-                except Exception as e:
-                    self.console.print(f"[red]Dashboard error: {e}[/red]")
-                    await asyncio.sleep(2)
+        # Each collector runs at its own cadence; rendering never waits on them
+        collectors = [
+            (self.collect_system_metrics, SYSTEM_INTERVAL),
+            (self.collect_service_metrics, SERVICE_INTERVAL),
+            (self.collect_security_metrics, SECURITY_INTERVAL),
+            (self.collect_ssl_metrics, SSL_CHECK_INTERVAL),
+        ]
+        tasks = [asyncio.create_task(self.run_periodic(collect, interval)) for collect, interval in collectors]
+        
+        try:
+            with Live(self.create_dashboard_layout(), auto_refresh=False, screen=True) as live:
+                while True:
+                    live.update(self.create_dashboard_layout(), refresh=True)
+                    await asyncio.sleep(RENDER_INTERVAL)
+        except KeyboardInterrupt:
+            self.console.print("[yellow]Dashboard stopped by user[/yellow]")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.close()
+    
+    async def run_periodic(self, collect, interval: float):
+        """Run one collector forever, every `interval` seconds"""
+        while True:
+            started = time.monotonic()
+            try:
+                await collect()
+            except Exception as e:
+                self.console.print(f"[red]Dashboard error: {e}[/red]")
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
 
 
 async def main():